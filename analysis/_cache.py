@@ -0,0 +1,78 @@
+import threading
+import weakref
+import numpy as np
+
+# PIL images define __eq__ and are therefore unhashable, so entries are keyed
+# by id() and evicted by a finalizer once the image is garbage collected.
+# Each entry carries its own lock so analyses running in parallel threads
+# compute a shared value once instead of racing to build it.
+_image_cache = {}
+_cache_lock = threading.Lock()
+
+def _slot(img):
+    key = id(img)
+    with _cache_lock:
+        slot = _image_cache.get(key)
+        if slot is None:
+            slot = _image_cache[key] = ({}, threading.RLock())
+            weakref.finalize(img, _image_cache.pop, key, None)
+    return slot
+
+def cached(img, name, compute):
+    """
+    Return the value cached under name for a PIL image, calling compute(img)
+    to build it on first use. Values live exactly as long as the image does.
+    """
+    entry, lock = _slot(img)
+    with lock:
+        value = entry.get(name)
+        if value is None:
+            value = entry[name] = compute(img)
+    return value
+
+def cached_pair(img_a, img_b, name, compute_pair, compute=None):
+    """
+    cached() for two images whose values are cheaper to build together.
+    compute_pair(img_a, img_b) returns both values; each is stored on its own
+    image, so later single-image lookups hit the cache. When only one value
+    is missing and compute is given, compute(img) builds just that one.
+    """
+    entry_a, lock_a = _slot(img_a)
+    entry_b, lock_b = _slot(img_b)
+    # Lock in a fixed order so concurrent pair lookups cannot deadlock
+    first, second = sorted((lock_a, lock_b), key=id)
+    with first, second:
+        missing_a = entry_a.get(name) is None
+        missing_b = entry_b.get(name) is None
+        if compute is not None and missing_a != missing_b:
+            img, entry = (img_a, entry_a) if missing_a else (img_b, entry_b)
+            entry[name] = compute(img)
+        elif missing_a or missing_b:
+            value_a, value_b = compute_pair(img_a, img_b)
+            entry_a.setdefault(name, value_a)
+            entry_b.setdefault(name, value_b)
+        return entry_a[name], entry_b[name]
+
+def _decode_rgb(img):
+    rgb = np.asarray(img if img.mode == 'RGB' else img.convert('RGB'))
+    rgb.flags.writeable = False
+    return rgb
+
+def _decode_gray(img):
+    gray = np.asarray(img.convert('L'))
+    gray.flags.writeable = False
+    return gray
+
+def gray_u8(img):
+    """
+    Return the 'L' luma of a PIL image as a read-only uint8 array.
+    The conversion runs once per image object; later calls share the array.
+    """
+    return cached(img, 'gray_u8', _decode_gray)
+
+def rgb_u8(img):
+    """
+    Return a PIL image as a read-only (H, W, 3) uint8 array, decoded once
+    per image object and shared by every analysis that needs RGB pixels.
+    """
+    return cached(img, 'rgb_u8', _decode_rgb)
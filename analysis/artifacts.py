@@ -1,44 +1,46 @@
 import numpy as np
 from PIL import Image
+from analysis._cache import gray_u8
 
 def detect_compression_artifacts(img):
     """
     Estimate compression artifacts (blockiness).
     """
-    gray = img.convert('L')
-    arr = np.array(gray, dtype=np.float32)
+    arr = gray_u8(img)
     
     # Check for 8x8 block boundaries
     # Calculate differences at 8-pixel intervals
     
+    def mean_abs_diff(a, b):
+        # Differences of uint8 views fit in int16; only the strided
+        # columns/rows are materialized, never the whole image
+        d = np.subtract(a, b, dtype=np.int16)
+        np.abs(d, out=d)
+        return d.mean()
+    
     h, w = arr.shape
     
     # Horizontal boundaries
-    diff_h = np.abs(arr[:, 7:w-1:8] - arr[:, 8:w:8])
+    diff_h = mean_abs_diff(arr[:, 7:w-1:8], arr[:, 8:w:8])
     # Vertical boundaries
-    diff_v = np.abs(arr[7:h-1:8, :] - arr[8:h:8, :])
+    diff_v = mean_abs_diff(arr[7:h-1:8, :], arr[8:h:8, :])
     
     # Non-boundary differences for normalization
-    diff_h_non = np.abs(arr[:, 3:w-5:8] - arr[:, 4:w-4:8])
-    diff_v_non = np.abs(arr[3:h-5:8, :] - arr[4:h-4:8, :])
+    diff_h_non = mean_abs_diff(arr[:, 3:w-5:8], arr[:, 4:w-4:8])
+    diff_v_non = mean_abs_diff(arr[3:h-5:8, :], arr[4:h-4:8, :])
     
-    score_h = np.mean(diff_h) - np.mean(diff_h_non)
-    score_v = np.mean(diff_v) - np.mean(diff_v_non)
+    score_h = diff_h - diff_h_non
+    score_v = diff_v - diff_v_non
     
     # Positive score indicates blockiness
-    score = max(0, score_h + score_v)
+    score = max(0.0, float(score_h + score_v))
     return score
 
 def detect_oversmoothing(img):
     """
     Detect oversmoothing (lack of texture).
     """
-    gray = img.convert('L')
-    arr = np.array(gray, dtype=np.float32)
-    
-    # Calculate local variance
     # Low variance everywhere = oversmoothed
-    
     # We can use Laplacian variance as a proxy for texture
     from analysis.sharpness import calculate_sharpness
     
@@ -1,5 +1,73 @@
+import functools
 import numpy as np
 from PIL import Image, ImageDraw, ImageFont
+from scipy import ndimage
+from analysis._cache import rgb_u8
+
+@functools.lru_cache(maxsize=8)
+def _font(size):
+    """Load the plot font once per size, falling back to PIL's default."""
+    try:
+        return ImageFont.truetype("arial.ttf", size)
+    except OSError:
+        return ImageFont.load_default()
+
+# Plot styling shared by the template and the per-call drawing
+_CHANNEL_COLORS = [(255, 80, 80), (80, 255, 80), (80, 80, 255)]  # R, G, B
+_BG_COLOR = (42, 42, 42)  # #2a2a2a
+_TEXT_COLOR = (230, 230, 230)  # #e6e6e6
+_GRID_COLOR = (64, 64, 64)  # #404040
+
+# Margins for axes
+_MARGIN_LEFT = 40
+_MARGIN_RIGHT = 10
+_MARGIN_TOP = 25
+_MARGIN_BOTTOM = 25
+
+@functools.lru_cache(maxsize=8)
+def _plot_template(width, height, is_difference):
+    """
+    Draw the static chrome of a histogram plot (axes, gridlines, labels, legend).
+    Cached per size; callers draw on a copy.
+    """
+    img = Image.new('RGB', (width, height), _BG_COLOR)
+    draw = ImageDraw.Draw(img)
+    font_label = _font(8)
+    plot_width = width - _MARGIN_LEFT - _MARGIN_RIGHT
+    plot_height = height - _MARGIN_TOP - _MARGIN_BOTTOM
+    
+    # Draw axes
+    # Y-axis
+    draw.line([(_MARGIN_LEFT, _MARGIN_TOP), (_MARGIN_LEFT, height - _MARGIN_BOTTOM)], 
+             fill=_GRID_COLOR, width=1)
+    # X-axis  
+    x_axis_y = height - _MARGIN_BOTTOM if not is_difference else (_MARGIN_TOP + plot_height // 2)
+    draw.line([(_MARGIN_LEFT, x_axis_y), (width - _MARGIN_RIGHT, x_axis_y)], 
+             fill=_GRID_COLOR, width=1)
+    
+    # Draw gridlines (vertical every 64 units = 4 lines)
+    for x_val in [0, 64, 128, 192, 255]:
+        x_px = _MARGIN_LEFT + int((x_val / 255.0) * plot_width)
+        draw.line([(x_px, _MARGIN_TOP), (x_px, height - _MARGIN_BOTTOM)], 
+                 fill=(_GRID_COLOR[0]//2, _GRID_COLOR[1]//2, _GRID_COLOR[2]//2), width=1)
+        # X-axis labels
+        draw.text((x_px, height - _MARGIN_BOTTOM + 5), str(x_val), 
+                 fill=_TEXT_COLOR, font=font_label, anchor="mt")
+    
+    # Y-axis label
+    draw.text((5, _MARGIN_TOP), "Freq", fill=_TEXT_COLOR, font=font_label, anchor="lt")
+    
+    # Draw legend
+    legend_x = width - _MARGIN_RIGHT - 60
+    legend_y = _MARGIN_TOP + 5
+    labels = ['R', 'G', 'B']
+    for i, (color, label) in enumerate(zip(_CHANNEL_COLORS, labels)):
+        y = legend_y + i * 12
+        draw.rectangle([legend_x, y, legend_x + 10, y + 8], fill=color)
+        draw.text((legend_x + 15, y + 4), label, fill=_TEXT_COLOR, 
+                 font=font_label, anchor="lm")
+    
+    return img
 
 def calculate_histogram_stats(img):
     """
@@ -9,14 +77,10 @@ def calculate_histogram_stats(img):
     if img.mode != 'RGB':
         img = img.convert('RGB')
         
-    arr = np.array(img)
+    arr = rgb_u8(img)
     
-    # Histogram per channel
-    hist_r, _ = np.histogram(arr[:,:,0], bins=256, range=(0,256))
-    hist_g, _ = np.histogram(arr[:,:,1], bins=256, range=(0,256))
-    hist_b, _ = np.histogram(arr[:,:,2], bins=256, range=(0,256))
-    
-    hist_combined = np.stack([hist_r, hist_g, hist_b])
+    # Histogram per channel (PIL counts all three bands in one C pass)
+    hist_combined = np.asarray(img.histogram(), dtype=np.int64).reshape(3, 256)
     
     # Brightness: Mean pixel value
     brightness = np.mean(arr)
@@ -67,7 +131,7 @@ def create_combined_histogram(plot_orig, plot_edit, plot_diff):
     total_height = height_per_plot * 3
     
     # Create combined image
-    combined = Image.new('RGB', (width, total_height), (42, 42, 42))
+    combined = Image.new('RGB', (width, total_height), _BG_COLOR)
     
     # Paste plots vertically
     combined.paste(plot_orig, (0, 0))
@@ -77,15 +141,17 @@ def create_combined_histogram(plot_orig, plot_edit, plot_diff):
     return combined
 
 def smooth_histogram(hist, window=3):
-    """Simple moving average smoothing"""
+    """
+    Simple moving average smoothing along the last axis.
+    The window is truncated at both ends, so edge bins average fewer values.
+    """
     if window < 2:
         return hist
-    smoothed = np.copy(hist).astype(float)
-    for i in range(len(hist)):
-        start = max(0, i - window // 2)
-        end = min(len(hist), i + window // 2 + 1)
-        smoothed[i] = np.mean(hist[start:end])
-    return smoothed
+    kernel = np.ones(2 * (window // 2) + 1)
+    hist = np.asarray(hist, dtype=float)
+    sums = ndimage.correlate1d(hist, kernel, axis=-1, mode='constant')
+    counts = np.convolve(np.ones(hist.shape[-1]), kernel, mode='same')
+    return sums / counts
 
 def plot_aligned_histograms_pil(hist_orig, hist_edited, width=340, height=100):
     """
@@ -97,12 +163,9 @@ def plot_aligned_histograms_pil(hist_orig, hist_edited, width=340, height=100):
     All plots share the same X-axis (0-255) and Y-axis scale.
     Uses PIL ImageDraw to create professional-looking aligned plots.
     """
-    # Apply smoothing
-    hist_orig_smooth = np.zeros_like(hist_orig).astype(float)
-    hist_edited_smooth = np.zeros_like(hist_edited).astype(float)
-    for ch in range(3):
-        hist_orig_smooth[ch] = smooth_histogram(hist_orig[ch], window=3)
-        hist_edited_smooth[ch] = smooth_histogram(hist_edited[ch], window=3)
+    # Apply smoothing (all three channels at once)
+    hist_orig_smooth = smooth_histogram(hist_orig, window=3)
+    hist_edited_smooth = smooth_histogram(hist_edited, window=3)
     
     # Calculate difference
     hist_diff = hist_edited_smooth - hist_orig_smooth
@@ -115,89 +178,37 @@ def plot_aligned_histograms_pil(hist_orig, hist_edited, width=340, height=100):
     )
     y_max = y_max * 1.1  # 10% padding
     
-    # Colors and settings
-    colors = [(255, 80, 80), (80, 255, 80), (80, 80, 255)]  # R, G, B
-    bg_color = (42, 42, 42)  # #2a2a2a
-    text_color = (230, 230, 230)  # #e6e6e6
-    grid_color = (64, 64, 64)  # #404040
+    # Plot area inside the fixed margins
+    plot_width = width - _MARGIN_LEFT - _MARGIN_RIGHT
+    plot_height = height - _MARGIN_TOP - _MARGIN_BOTTOM
     
-    # Margins for axes
-    margin_left = 40
-    margin_right = 10
-    margin_top = 25
-    margin_bottom = 25
-    plot_width = width - margin_left - margin_right
-    plot_height = height - margin_top - margin_bottom
+    # X pixel position of each of the 256 bins, shared by every plot
+    bin_x_px = (_MARGIN_LEFT + np.trunc(np.arange(256) / 255.0 * plot_width)).astype(np.int32).tolist()
     
     def create_plot(hist_data, title, is_difference=False):
         """Helper to create a single histogram plot"""
-        img = Image.new('RGB', (width, height), bg_color)
+        # Axes, gridlines, labels and legend come from the cached template
+        img = _plot_template(width, height, is_difference).copy()
         draw = ImageDraw.Draw(img, 'RGBA')
         
         # Draw title
-        try:
-            font_title = ImageFont.truetype("arial.ttf", 10)
-            font_label = ImageFont.truetype("arial.ttf", 8)
-        except:
-            font_title = ImageFont.load_default()
-            font_label = ImageFont.load_default()
-        
-        draw.text((width // 2, 5), title, fill=text_color, font=font_title, anchor="mt")
-        
-        # Draw axes
-        # Y-axis
-        draw.line([(margin_left, margin_top), (margin_left, height - margin_bottom)], 
-                 fill=grid_color, width=1)
-        # X-axis  
-        x_axis_y = height - margin_bottom if not is_difference else (margin_top + plot_height // 2)
-        draw.line([(margin_left, x_axis_y), (width - margin_right, x_axis_y)], 
-                 fill=grid_color, width=1)
-        
-        # Draw gridlines (vertical every 64 units = 4 lines)
-        for x_val in [0, 64, 128, 192, 255]:
-            x_px = margin_left + int((x_val / 255.0) * plot_width)
-            draw.line([(x_px, margin_top), (x_px, height - margin_bottom)], 
-                     fill=(grid_color[0]//2, grid_color[1]//2, grid_color[2]//2), width=1)
-            # X-axis labels
-            draw.text((x_px, height - margin_bottom + 5), str(x_val), 
-                     fill=text_color, font=font_label, anchor="mt")
+        draw.text((width // 2, 5), title, fill=_TEXT_COLOR, font=_font(10), anchor="mt")
         
-        # Y-axis label
-        draw.text((5, margin_top), "Freq", fill=text_color, font=font_label, anchor="lt")
-        
-        # PlotEach channel
+        # Plot each channel as one polyline
         for ch in range(3):
-            points = []
-            for x in range(256):
-                x_px = margin_left + int((x / 255.0) * plot_width)
-                
-                if is_difference:
-                    # Center around middle for difference
-                    val = hist_data[ch, x]
-                    y_offset = -int((val / y_max) * (plot_height / 2))
-                    y_px = (margin_top + plot_height // 2) + y_offset
-                else:
-                    # Normal histogram from bottom
-                    val = hist_data[ch, x]
-                    y_offset = int((val / y_max) * plot_height)
-                    y_px = (height - margin_bottom) - y_offset
-                
-                points.append((x_px, y_px))
+            if is_difference:
+                # Center around middle for difference
+                y_offset = -np.trunc(hist_data[ch] / y_max * (plot_height / 2)).astype(np.int32)
+                y_px = (_MARGIN_TOP + plot_height // 2) + y_offset
+            else:
+                # Normal histogram from bottom
+                y_offset = np.trunc(hist_data[ch] / y_max * plot_height).astype(np.int32)
+                y_px = (height - _MARGIN_BOTTOM) - y_offset
+            
+            points = list(zip(bin_x_px, y_px.tolist()))
             
             # Draw with transparency
-            for i in range(len(points) - 1):
-                draw.line([points[i], points[i + 1]], 
-                         fill=colors[ch] + (180,), width=2)  # Alpha = 180/255 ≈ 0.7
-        
-        # Draw legend
-        legend_x = width - margin_right - 60
-        legend_y = margin_top + 5
-        labels = ['R', 'G', 'B']
-        for i, (color, label) in enumerate(zip(colors, labels)):
-            y = legend_y + i * 12
-            draw.rectangle([legend_x, y, legend_x + 10, y + 8], fill=color)
-            draw.text((legend_x + 15, y + 4), label, fill=text_color, 
-                     font=font_label, anchor="lm")
+            draw.line(points, fill=_CHANNEL_COLORS[ch] + (180,), width=2)  # Alpha = 180/255 ≈ 0.7
         
         return img
     
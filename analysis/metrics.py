@@ -1,71 +1,101 @@
 import numpy as np
-from PIL import Image
+from PIL import Image, ImageOps
 import math
+from scipy import ndimage
+from analysis._cache import gray_u8, rgb_u8
+
+def _small(img, max_side=1024):
+    """
+    Downscale img to fit max_side for global statistics that do not depend on
+    resolution (SNR, entropy). Images already small enough are returned as is.
+    """
+    if max(img.size) <= max_side:
+        return img
+    return ImageOps.contain(img, (max_side, max_side), Image.Resampling.BILINEAR)
+
+# Array-level kernels. analyze_metrics decodes each image once and passes the
+# same arrays to all of these; the calculate_* wrappers below take PIL images.
+
+def _mse(arr1, arr2, buf=None):
+    """Mean Squared Error of two equally shaped arrays, using buf as float64 scratch"""
+    if buf is None:
+        buf = np.empty(arr1.shape, dtype=np.float64)
+    np.subtract(arr1, arr2, out=buf, dtype=np.float64)
+    # Sum of squares as a dot product: no separate squaring pass over buf.
+    # float64 throughout, as a float32 dot drifts in the second decimal.
+    diff = buf.ravel()
+    return float(np.dot(diff, diff)) / diff.size
+
+def _psnr(mse):
+    """Peak Signal-to-Noise Ratio for a given MSE"""
+    if mse == 0:
+        return float('inf')
+    max_pixel = 255.0
+    return 10 * math.log10(max_pixel * max_pixel / mse)
+
+def _snr(arr):
+    """Signal-to-Noise Ratio of an array"""
+    # Reduce the uint8 pixels directly, accumulating in float64
+    mean_signal = arr.mean(dtype=np.float64)
+    std_noise = arr.std(dtype=np.float64)
+    if std_noise == 0:
+        return float('inf')
+    return 20 * math.log10(mean_signal / std_noise)
+
+def _ssim(g1, g2):
+    """Mean SSIM of two grayscale arrays over 11x11 Gaussian windows"""
+    i1 = g1.astype(np.float32)
+    i2 = g2.astype(np.float32)
+
+    # Constants
+    c1 = (0.01 * 255) ** 2
+    c2 = (0.03 * 255) ** 2
+
+    # Local statistics: sigma 1.5, truncated to an 11x11 window
+    def g(x):
+        return ndimage.gaussian_filter(x, sigma=1.5, truncate=3.5)
+
+    mu1 = g(i1)
+    mu2 = g(i2)
+    mu11 = mu1 * mu1
+    mu22 = mu2 * mu2
+    mu12 = mu1 * mu2
+    sigma1_sq = g(i1 * i1) - mu11
+    sigma2_sq = g(i2 * i2) - mu22
+    sigma12 = g(i1 * i2) - mu12
+
+    # SSIM Formula, per pixel
+    num = (2 * mu12 + c1) * (2 * sigma12 + c2)
+    den = (mu11 + mu22 + c1) * (sigma1_sq + sigma2_sq + c2)
+
+    return float((num / den).mean())
 
 def calculate_mse(img1, img2):
     """Calculate Mean Squared Error"""
-    arr1 = np.array(img1, dtype=np.float32)
-    arr2 = np.array(img2, dtype=np.float32)
-    mse = np.mean((arr1 - arr2) ** 2)
-    return mse
+    return _mse(rgb_u8(img1), rgb_u8(img2))
 
 def calculate_psnr(img1, img2):
     """Calculate Peak Signal-to-Noise Ratio"""
-    mse = calculate_mse(img1, img2)
-    if mse == 0:
-        return float('inf')
-    max_pixel = 255.0
-    psnr = 20 * math.log10(max_pixel / math.sqrt(mse))
-    return psnr
+    return _psnr(calculate_mse(img1, img2))
 
 def calculate_snr(img):
     """Calculate Signal-to-Noise Ratio"""
-    arr = np.array(img, dtype=np.float32)
-    mean_signal = np.mean(arr)
-    std_noise = np.std(arr)
-    if std_noise == 0:
-        return float('inf')
-    snr = 20 * math.log10(mean_signal / std_noise)
-    return snr
+    return _snr(rgb_u8(_small(img)))
 
 def calculate_entropy(img):
     """Calculate Image Entropy"""
-    gray = img.convert('L')
-    histogram = gray.histogram()
-    histogram_length = sum(histogram)
-    samples_probability = [float(h) / histogram_length for h in histogram]
-    entropy = -sum([p * math.log(p, 2) for p in samples_probability if p != 0])
-    return entropy
+    histogram = np.bincount(gray_u8(_small(img)).ravel(), minlength=256)
+    p = histogram[histogram > 0] / histogram.sum()
+    entropy = -np.sum(p * np.log2(p))
+    return float(entropy)
 
 def calculate_ssim(img1, img2):
     """
-    Calculate Structural Similarity Index (SSIM) - Simplified Numpy Implementation
+    Calculate Structural Similarity Index (SSIM) - mean of the local SSIM map
     Based on Wang et al. (2004)
     """
     # Convert to grayscale for SSIM
-    i1 = np.array(img1.convert('L'), dtype=np.float32)
-    i2 = np.array(img2.convert('L'), dtype=np.float32)
-    
-    # Constants
-    c1 = (0.01 * 255) ** 2
-    c2 = (0.03 * 255) ** 2
-    
-    # Mean
-    mu1 = np.mean(i1)
-    mu2 = np.mean(i2)
-    
-    # Variance
-    sigma1_sq = np.var(i1)
-    sigma2_sq = np.var(i2)
-    
-    # Covariance
-    sigma12 = np.mean((i1 - mu1) * (i2 - mu2))
-    
-    # SSIM Formula
-    num = (2 * mu1 * mu2 + c1) * (2 * sigma12 + c2)
-    den = (mu1**2 + mu2**2 + c1) * (sigma1_sq + sigma2_sq + c2)
-    
-    return num / den
+    return _ssim(gray_u8(img1), gray_u8(img2))
 
 def analyze_metrics(img_orig, img_edited):
     """Run all metrics"""
@@ -74,17 +104,18 @@ def analyze_metrics(img_orig, img_edited):
         img_edited_resized = img_edited.resize(img_orig.size)
     else:
         img_edited_resized = img_edited
-        
-    mse = calculate_mse(img_orig, img_edited_resized)
-    psnr = calculate_psnr(img_orig, img_edited_resized)
-    ssim = calculate_ssim(img_orig, img_edited_resized)
-    
+
+    # Decoded arrays are cached per image and shared with the other analyses
+    mse = _mse(rgb_u8(img_orig), rgb_u8(img_edited_resized))
+    psnr = _psnr(mse)
+    ssim = _ssim(gray_u8(img_orig), gray_u8(img_edited_resized))
+
     snr_orig = calculate_snr(img_orig)
     snr_edit = calculate_snr(img_edited)
-    
+
     entropy_orig = calculate_entropy(img_orig)
     entropy_edit = calculate_entropy(img_edited)
-    
+
     return {
         "mse": mse,
         "psnr": psnr,
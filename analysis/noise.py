@@ -1,28 +1,17 @@
 import numpy as np
 from PIL import Image
+from scipy import ndimage
 from utils import normalize_array
+from analysis._cache import gray_u8
+from analysis.fused import gray_features
 
 def calculate_local_variance(img):
     """
     Calculate 3x3 local variance for noise estimation.
     Returns: (variance_map_image, heatmap_image, mean_variance, variance_array)
     """
-    gray = img.convert('L')
-    arr = np.array(gray, dtype=np.float32)
-    
-    # Pad for 3x3 window
-    padded = np.pad(arr, ((1, 1), (1, 1)), mode='reflect')
-    
-    # Collect all 9 neighbors
-    neighbors = []
-    for i in range(3):
-        for j in range(3):
-            neighbors.append(padded[i:i+arr.shape[0], j:j+arr.shape[1]])
-            
-    stack = np.stack(neighbors, axis=0)
-    
-    # Calculate variance along the stack axis (axis 0)
-    local_var = np.var(stack, axis=0)
+    # 3x3 window variance shared with the other gray-level analyses
+    local_var = gray_features(img)["local_var"]
     
     mean_var = np.mean(local_var)
     
@@ -33,7 +22,7 @@ def calculate_local_variance(img):
     # High noise (yellow) = (255, 255, 0)
     # Low noise (blue) = (0, 0, 255)
     
-    heatmap = np.zeros((arr.shape[0], arr.shape[1], 3), dtype=np.uint8)
+    heatmap = np.zeros((local_var.shape[0], local_var.shape[1], 3), dtype=np.uint8)
     
     heatmap[:, :, 0] = var_norm # R
     heatmap[:, :, 1] = var_norm # G
@@ -45,21 +34,16 @@ def estimate_gaussian_noise(img):
     """
     Estimate Gaussian noise standard deviation.
     """
-    gray = img.convert('L')
-    arr = np.array(gray, dtype=np.float32)
+    arr = gray_u8(img)
     
     h, w = arr.shape
     if h < 3 or w < 3: return 0.0
     
-    padded = np.pad(arr, ((1, 1), (1, 1)), mode='edge')
-    
     # Convolve with Laplacian-like kernel
-    # [[1, -2, 1], [-2, 4, -2], [1, -2, 1]]
-    conv = (
-        1*padded[:-2, :-2] + -2*padded[:-2, 1:-1] + 1*padded[:-2, 2:] +
-        -2*padded[1:-1, :-2] + 4*padded[1:-1, 1:-1] + -2*padded[1:-1, 2:] +
-        1*padded[2:, :-2] + -2*padded[2:, 1:-1] + 1*padded[2:, 2:]
-    )
+    # [[1, -2, 1], [-2, 4, -2], [1, -2, 1]] = [1, -2, 1]^T x [1, -2, 1]
+    # First pass reads the uint8 gray straight into float32, second runs in place
+    conv = ndimage.correlate1d(arr, [1, -2, 1], axis=1, mode='nearest', output=np.float32)
+    ndimage.correlate1d(conv, [1, -2, 1], axis=0, mode='nearest', output=conv)
     
     # sigma = std(conv) / 6.0
     sigma = np.std(conv) / 6.0
@@ -79,12 +63,10 @@ def analyze_noise(img_orig, img_edited):
     threshold = 5.0 # Variance threshold
     
     # Noise Increased -> Green (Positive diff)
-    mask_inc = diff > threshold
-    diff_map[mask_inc, 1] = 255 
+    diff_map[..., 1] = (diff > threshold).view(np.uint8) * 255
     
     # Noise Decreased -> Red (Negative diff)
-    mask_dec = diff < -threshold
-    diff_map[mask_dec, 0] = 255
+    diff_map[..., 0] = (diff < -threshold).view(np.uint8) * 255
     
     diff_img = Image.fromarray(diff_map, 'RGB')
     
@@ -1,26 +1,14 @@
 import numpy as np
 from PIL import Image
+from analysis.fused import gray_features
 
 def calculate_sharpness(img):
     """
     Calculate sharpness using Laplacian variance.
     """
-    gray = img.convert('L')
-    arr = np.array(gray, dtype=np.float32)
-    
     # Laplacian Kernel
     # [[0, 1, 0], [1, -4, 1], [0, 1, 0]]
-    
-    padded = np.pad(arr, ((1, 1), (1, 1)), mode='edge')
-    
-    # Simple convolution
-    top = padded[:-2, 1:-1]
-    bottom = padded[2:, 1:-1]
-    left = padded[1:-1, :-2]
-    right = padded[1:-1, 2:]
-    center = padded[1:-1, 1:-1]
-    
-    laplacian = top + bottom + left + right - 4 * center
+    laplacian = gray_features(img)["lap"]
     
     variance = np.var(laplacian)
     return variance
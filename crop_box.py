@@ -36,12 +36,18 @@ class CropBox:
         self.drag_start_x = 0
         self.drag_start_y = 0
         self.drag_start_rect = (0, 0, 0, 0)
+        self._drag_pos = None
+        self._drag_job = None
         
-        # Canvas items
+        # Canvas items (created by draw, moved in place while dragging)
         self.overlay_items = []
         self.box_items = []
         self.handle_items = {}
         
+        # Handle centres, recomputed only when the rectangle they were built for changes
+        self._handles = {}
+        self._handles_rect = None
+        
         # Handle size
         self.handle_size = 12
         self.min_size = 20
@@ -51,18 +57,19 @@ class CropBox:
         self.handle_color = "#FF9B00"
         self.overlay_color = "#000000"
         self.overlay_alpha = 0.5
+        self.grid_dash = (4, 4)
         
     def draw(self):
-        """Draw the crop box, handles, and overlay."""
+        """Create the crop box, handles, and overlay items and position them."""
         self.clear()
         
+        # Items are created once here; drags only move them (see _update_geometry)
         # Draw semi-transparent overlay outside crop box
         self._draw_overlay()
         
         # Draw crop box rectangle
         box_id = self.canvas.create_rectangle(
-            self.x, self.y,
-            self.x + self.width, self.y + self.height,
+            0, 0, 0, 0,
             outline=self.box_color,
             width=2,
             tags="cropbox"
@@ -75,114 +82,101 @@ class CropBox:
         # Draw 8 handles
         self._draw_handles()
         
+        self._update_geometry()
+        
     def _draw_overlay(self):
-        """Draw semi-transparent overlay outside crop box."""
-        # Top overlay
-        if self.y > self.img_y:
-            overlay = self.canvas.create_rectangle(
-                self.img_x, self.img_y,
-                self.img_x + self.img_w, self.y,
-                fill=self.overlay_color,
-                stipple="gray50",
-                outline="",
-                tags="crop_overlay"
-            )
-            self.overlay_items.append(overlay)
-        
-        # Bottom overlay
-        if self.y + self.height < self.img_y + self.img_h:
-            overlay = self.canvas.create_rectangle(
-                self.img_x, self.y + self.height,
-                self.img_x + self.img_w, self.img_y + self.img_h,
-                fill=self.overlay_color,
-                stipple="gray50",
-                outline="",
-                tags="crop_overlay"
-            )
-            self.overlay_items.append(overlay)
-        
-        # Left overlay
-        if self.x > self.img_x:
-            overlay = self.canvas.create_rectangle(
-                self.img_x, self.y,
-                self.x, self.y + self.height,
-                fill=self.overlay_color,
-                stipple="gray50",
-                outline="",
-                tags="crop_overlay"
-            )
-            self.overlay_items.append(overlay)
-        
-        # Right overlay
-        if self.x + self.width < self.img_x + self.img_w:
-            overlay = self.canvas.create_rectangle(
-                self.x + self.width, self.y,
-                self.img_x + self.img_w, self.y + self.height,
-                fill=self.overlay_color,
-                stipple="gray50",
-                outline="",
-                tags="crop_overlay"
-            )
-            self.overlay_items.append(overlay)
+        """Create the semi-transparent overlay outside the crop box."""
+        # One polygon with the crop box cut out as a hole (see _update_geometry),
+        # instead of four separate rectangles
+        overlay = self.canvas.create_polygon(
+            0, 0, 0, 0, 0, 0,
+            fill=self.overlay_color,
+            stipple="gray50",
+            outline="",
+            tags="crop_overlay"
+        )
+        self.overlay_items.append(overlay)
     
     def _draw_grid(self):
-        """Draw rule of thirds grid lines."""
-        # Vertical lines
-        x1 = self.x + self.width // 3
-        x2 = self.x + 2 * self.width // 3
-        
-        line1 = self.canvas.create_line(
-            x1, self.y, x1, self.y + self.height,
-            fill=self.box_color, width=1, dash=(4, 4), tags="cropbox"
-        )
-        line2 = self.canvas.create_line(
-            x2, self.y, x2, self.y + self.height,
-            fill=self.box_color, width=1, dash=(4, 4), tags="cropbox"
-        )
-        self.box_items.extend([line1, line2])
-        
-        # Horizontal lines
-        y1 = self.y + self.height // 3
-        y2 = self.y + 2 * self.height // 3
-        
-        line3 = self.canvas.create_line(
-            self.x, y1, self.x + self.width, y1,
-            fill=self.box_color, width=1, dash=(4, 4), tags="cropbox"
-        )
-        line4 = self.canvas.create_line(
-            self.x, y2, self.x + self.width, y2,
-            fill=self.box_color, width=1, dash=(4, 4), tags="cropbox"
-        )
-        self.box_items.extend([line3, line4])
+        """Create the rule of thirds grid lines."""
+        for _ in range(4):
+            line = self.canvas.create_line(
+                0, 0, 0, 0,
+                fill=self.box_color, width=1, dash=self.grid_dash, tags=("cropbox", "crop_grid")
+            )
+            self.box_items.append(line)
     
     def _draw_handles(self):
-        """Draw 8 resize handles."""
-        hs = self.handle_size
-        
-        # Corner handles
-        handles = {
-            'nw': (self.x, self.y),
-            'ne': (self.x + self.width, self.y),
-            'sw': (self.x, self.y + self.height),
-            'se': (self.x + self.width, self.y + self.height),
-            # Side handles
-            'n': (self.x + self.width // 2, self.y),
-            's': (self.x + self.width // 2, self.y + self.height),
-            'w': (self.x, self.y + self.height // 2),
-            'e': (self.x + self.width, self.y + self.height // 2),
-        }
-        
-        for handle_name, (hx, hy) in handles.items():
+        """Create the 8 resize handles."""
+        for handle_name in self._handle_positions():
             handle = self.canvas.create_rectangle(
-                hx - hs // 2, hy - hs // 2,
-                hx + hs // 2, hy + hs // 2,
+                0, 0, 0, 0,
                 fill=self.handle_color,
                 outline=self.box_color,
                 width=2,
-                tags=f"crop_handle_{handle_name}"
+                tags=("crop_handle", f"crop_handle_{handle_name}")
             )
             self.handle_items[handle_name] = handle
     
+    def _handle_positions(self):
+        """
+        Centre point of each of the 8 handles, corners first.
+        Cached until the crop rectangle changes, since hit-testing asks on every mouse event.
+        """
+        rect = (self.x, self.y, self.width, self.height)
+        if self._handles_rect != rect:
+            x, y, w, h = rect
+            self._handles = {
+                'nw': (x, y),
+                'ne': (x + w, y),
+                'sw': (x, y + h),
+                'se': (x + w, y + h),
+                # Side handles
+                'n': (x + w // 2, y),
+                's': (x + w // 2, y + h),
+                'w': (x, y + h // 2),
+                'e': (x + w, y + h // 2),
+            }
+            self._handles_rect = rect
+        return self._handles
+    
+    def _update_geometry(self):
+        """Move the existing canvas items to the current crop rectangle."""
+        if not self.box_items:
+            return
+        
+        x, y, w, h = self.x, self.y, self.width, self.height
+        img_right = self.img_x + self.img_w
+        img_bottom = self.img_y + self.img_h
+        coords = self.canvas.coords
+        
+        # Overlay: image outline clockwise, then the crop box counter-clockwise
+        # so the box is left unfilled under either fill rule
+        coords(self.overlay_items[0],
+               self.img_x, self.img_y, img_right, self.img_y,
+               img_right, img_bottom, self.img_x, img_bottom,
+               self.img_x, self.img_y,
+               x, y, x, y + h, x + w, y + h, x + w, y, x, y)
+        
+        # Box outline and rule of thirds lines
+        box, line1, line2, line3, line4 = self.box_items
+        coords(box, x, y, x + w, y + h)
+        x1 = x + w // 3
+        x2 = x + 2 * w // 3
+        y1 = y + h // 3
+        y2 = y + 2 * h // 3
+        coords(line1, x1, y, x1, y + h)
+        coords(line2, x2, y, x2, y + h)
+        coords(line3, x, y1, x + w, y1)
+        coords(line4, x, y2, x + w, y2)
+        
+        # Handles
+        hs = self.handle_size
+        for handle_name, (hx, hy) in self._handle_positions().items():
+            coords(self.handle_items[handle_name],
+                   hx - hs // 2, hy - hs // 2,
+                   hx + hs // 2, hy + hs // 2)
+    
     def get_handle_at(self, x, y):
         """
         Detect which handle or area was clicked.
@@ -193,18 +187,7 @@ class CropBox:
         hs = self.handle_size
         
         # Check corner handles first
-        handles = {
-            'nw': (self.x, self.y),
-            'ne': (self.x + self.width, self.y),
-            'sw': (self.x, self.y + self.height),
-            'se': (self.x + self.width, self.y + self.height),
-            'n': (self.x + self.width // 2, self.y),
-            's': (self.x + self.width // 2, self.y + self.height),
-            'w': (self.x, self.y + self.height // 2),
-            'e': (self.x + self.width, self.y + self.height // 2),
-        }
-        
-        for handle_name, (hx, hy) in handles.items():
+        for handle_name, (hx, hy) in self._handle_positions().items():
             if abs(x - hx) <= hs and abs(y - hy) <= hs:
                 return handle_name
         
@@ -236,12 +219,32 @@ class CropBox:
         }
         cursor = cursor_map.get(handle, 'arrow')
         self.canvas.config(cursor=cursor)
+        
+        # Draw the grid solid while dragging; dashed lines are re-rasterized on every move
+        self.canvas.itemconfigure("crop_grid", dash=())
     
     def update_drag(self, x, y):
-        """Update crop box during drag."""
+        """
+        Queue a drag update. Motion events arrive faster than the canvas
+        redraws, so only the latest position is applied, once per idle cycle.
+        """
         if not self.active_handle:
             return
         
+        self._drag_pos = (x, y)
+        if self._drag_job is None:
+            self._drag_job = self.canvas.after_idle(self._flush_drag)
+    
+    def _flush_drag(self):
+        """Apply the most recent queued drag position."""
+        self._drag_job = None
+        if self.active_handle and self._drag_pos is not None:
+            self._apply_drag(*self._drag_pos)
+            self._update_geometry()
+        self._drag_pos = None
+    
+    def _apply_drag(self, x, y):
+        """Update the crop rectangle for the pointer at (x, y)."""
         dx = x - self.drag_start_x
         dy = y - self.drag_start_y
         
@@ -302,55 +305,48 @@ class CropBox:
             # Resize from right
             self.width = start_w + dx
             self._constrain_resize()
-        
-        self.draw()
     
     def _constrain_to_bounds(self):
         """Keep crop box within image bounds."""
-        # Constrain x
-        if self.x < self.img_x:
-            self.x = self.img_x
-        if self.x + self.width > self.img_x + self.img_w:
-            self.x = self.img_x + self.img_w - self.width
-        
-        # Constrain y
-        if self.y < self.img_y:
-            self.y = self.img_y
-        if self.y + self.height > self.img_y + self.img_h:
-            self.y = self.img_y + self.img_h - self.height
+        # Clamp to the left/top edge first; the right/bottom edge wins if both apply
+        self.x = min(max(self.x, self.img_x), self.img_x + self.img_w - self.width)
+        self.y = min(max(self.y, self.img_y), self.img_y + self.img_h - self.height)
     
     def _constrain_resize(self):
         """Constrain resize to minimum size and image bounds."""
-        # Enforce minimum size
-        if self.width < self.min_size:
-            if self.active_handle in ['nw', 'w', 'sw']:
-                self.x = self.x + self.width - self.min_size
-            self.width = self.min_size
-        
-        if self.height < self.min_size:
-            if self.active_handle in ['nw', 'n', 'ne']:
-                self.y = self.y + self.height - self.min_size
-            self.height = self.min_size
-        
-        # Constrain to image bounds
-        if self.x < self.img_x:
-            self.width += self.x - self.img_x
-            self.x = self.img_x
-        
-        if self.y < self.img_y:
-            self.height += self.y - self.img_y
-            self.y = self.img_y
-        
-        if self.x + self.width > self.img_x + self.img_w:
-            self.width = self.img_x + self.img_w - self.x
-        
-        if self.y + self.height > self.img_y + self.img_h:
-            self.height = self.img_y + self.img_h - self.y
+        # Enforce minimum size, keeping the edge opposite the dragged handle fixed
+        new_width = max(self.width, self.min_size)
+        if self.active_handle in ('nw', 'w', 'sw'):
+            self.x += self.width - new_width
+        self.width = new_width
+        
+        new_height = max(self.height, self.min_size)
+        if self.active_handle in ('nw', 'n', 'ne'):
+            self.y += self.height - new_height
+        self.height = new_height
+        
+        # Constrain to image bounds: trim whatever sticks out past the left/top
+        # edge, then cap the size at the right/bottom edge
+        overflow_x = max(self.img_x - self.x, 0)
+        self.x += overflow_x
+        self.width -= overflow_x
+        
+        overflow_y = max(self.img_y - self.y, 0)
+        self.y += overflow_y
+        self.height -= overflow_y
+        
+        self.width = min(self.width, self.img_x + self.img_w - self.x)
+        self.height = min(self.height, self.img_y + self.img_h - self.y)
     
     def end_drag(self):
         """End dragging operation."""
+        # Apply a still-queued position so the final rectangle matches the pointer
+        if self._drag_job is not None:
+            self.canvas.after_cancel(self._drag_job)
+            self._flush_drag()
         self.active_handle = None
         self.canvas.config(cursor="")
+        self.canvas.itemconfigure("crop_grid", dash=self.grid_dash)
     
     def get_crop_rect(self):
         """
@@ -366,8 +362,8 @@ class CropBox:
     
     def clear(self):
         """Remove all crop box elements from canvas."""
-        for item in self.overlay_items + self.box_items + list(self.handle_items.values()):
-            self.canvas.delete(item)
+        # Every item carries one of these tags; a single delete removes them all
+        self.canvas.delete("cropbox", "crop_overlay", "crop_handle")
         
         self.overlay_items = []
         self.box_items = []
@@ -1,17 +1,111 @@
-from PIL import Image, ImageEnhance, ImageFilter, ImageOps
+import functools
+import math
+import weakref
+import numpy as np
+from PIL import Image, ImageEnhance, ImageFilter, ImageOps, ImageStat
+
+# RGB -> RGB color matrices for convert(), one row per output channel
+_SEPIA_MATRIX = (0.393, 0.769, 0.189, 0,
+                 0.349, 0.686, 0.168, 0,
+                 0.272, 0.534, 0.131, 0)
+_WARMTH_MATRIX = (1.1, 0, 0, 0,
+                  0, 1, 0, 0,
+                  0, 0, 0.9, 0)
+_COOL_MATRIX = (0.9, 0, 0, 0,
+                0, 1, 0, 0,
+                0, 0, 1.1, 0)
+
+# ITU-R 601-2 luma weights, as used by PIL's RGB -> L conversion
+_LUMA_WEIGHTS = (0.299, 0.587, 0.114)
+
+@functools.lru_cache(maxsize=64)
+def _highlights_lut(factor):
+    """256-entry LUT keeping values <= 128 and scaling the part above 128 by factor."""
+    x = np.arange(256, dtype=np.float64)
+    lut = np.where(x <= 128, x, np.clip(128 + (x - 128) * factor, 0, 255))
+    return tuple(lut.astype(np.uint8).tolist())
+
+@functools.lru_cache(maxsize=64)
+def _blend_lut(base, factor):
+    """
+    256-entry LUT for ImageEnhance's blend from a constant base level towards
+    each value by factor, in float32, truncated and clipped the way libImaging does.
+    """
+    x = np.arange(256, dtype=np.float32)
+    base = np.float32(base)
+    lut = np.clip(np.trunc(base + np.float32(factor) * (x - base)), 0, 255)
+    return tuple(lut.astype(np.uint8).tolist())
+
+def _enhance(img, enhancer, base, factor):
+    """
+    Apply an ImageEnhance adjustment as a single point() LUT pass instead of
+    building a degenerate image and blending. Modes other than RGB and L fall
+    back to the enhancer.
+    """
+    if img.mode not in ('RGB', 'L'):
+        return enhancer(img).enhance(factor)
+    return img.point(_blend_lut(base, factor) * len(img.getbands()))
+
+@functools.lru_cache(maxsize=2)
+def _vignette_mask(width, height, intensity):
+    """
+    'L' vignette mask for an image size: 255 at the center, falling off
+    quadratically towards the edges. Cached, as the pipeline re-applies the
+    vignette to same-sized images on every edit.
+    """
+    # Normalized squared distance from the center, 1.0 on the inscribed ellipse.
+    # Built from a column and a row that broadcast into one float32 array.
+    dy = (np.arange(height, dtype=np.float32) + 0.5 - height / 2) / (height / 2)
+    dx = (np.arange(width, dtype=np.float32) + 0.5 - width / 2) / (width / 2)
+    d2 = np.square(dy)[:, None] + np.square(dx)[None, :]
+    
+    # Quadratic falloff; the default intensity of 0.5 reaches black on the ellipse
+    d2 *= -255 * (2 * intensity)
+    d2 += 255
+    np.clip(d2, 0, 255, out=d2)
+    return Image.fromarray(d2.astype(np.uint8), 'L')
+
+# Most recent result per source image: {id(img): (op, params, result)}.
+# PIL images are unhashable, so entries are keyed by id() and dropped by a
+# finalizer with the source. Holding one result per source means a pipeline
+# re-run keeps exactly one image per stage and reuses every stage whose input
+# and parameters are unchanged.
+_op_cache = {}
+
+def _memoized(func):
+    """Reuse func's previous result when called again on the same image with the same arguments."""
+    op = func.__name__
+    
+    @functools.wraps(func)
+    def wrapper(img, *args, **kwargs):
+        key = id(img)
+        params = (args, tuple(sorted(kwargs.items())))
+        entry = _op_cache.get(key)
+        if entry is not None and entry[0] == op and entry[1] == params:
+            return entry[2]
+        result = func(img, *args, **kwargs)
+        if entry is None:
+            weakref.finalize(img, _op_cache.pop, key, None)
+        _op_cache[key] = (op, params, result)
+        return result
+    return wrapper
 
 class ImageEditor:
     @staticmethod
+    @_memoized
     def adjust_brightness(img, factor):
-        enhancer = ImageEnhance.Brightness(img)
-        return enhancer.enhance(factor)
+        # Blend from black
+        return _enhance(img, ImageEnhance.Brightness, 0, factor)
 
     @staticmethod
+    @_memoized
     def adjust_contrast(img, factor):
-        enhancer = ImageEnhance.Contrast(img)
-        return enhancer.enhance(factor)
+        # Blend from the mean gray level
+        mean = int(ImageStat.Stat(img.convert("L")).mean[0] + 0.5)
+        return _enhance(img, ImageEnhance.Contrast, mean, factor)
 
     @staticmethod
+    @_memoized
     def rotate(img, angle):
         return img.rotate(angle, expand=True)
 
@@ -25,16 +119,15 @@ class ImageEditor:
         return img.resize(size, Image.Resampling.LANCZOS)
 
     @staticmethod
+    @_memoized
     def to_grayscale(img):
         return ImageOps.grayscale(img).convert("RGB")
 
     @staticmethod
+    @_memoized
     def apply_sepia(img):
-        # Sepia matrix
-        sepia_filter = (0.393, 0.769, 0.189, 0,
-                        0.349, 0.686, 0.168, 0,
-                        0.272, 0.534, 0.131, 0)
-        img = img.convert("RGB")
+        if img.mode != "RGB":
+            img = img.convert("RGB")
         # Apply matrix
         # PIL convert allows matrix but it's for RGB -> RGB
         # We can use color matrix
@@ -42,159 +135,119 @@ class ImageEditor:
         # R = Tr * 0.393 + Tg * 0.769 + Tb * 0.189
         # etc.
         # Easier way using PIL internal matrix conversion:
-        return img.convert("RGB", matrix=sepia_filter)
+        return img.convert("RGB", matrix=_SEPIA_MATRIX)
 
     @staticmethod
+    @_memoized
     def blur(img, radius=2):
         return img.filter(ImageFilter.GaussianBlur(radius))
 
     @staticmethod
+    @_memoized
     def sharpen(img):
         return img.filter(ImageFilter.SHARPEN)
 
     @staticmethod
+    @_memoized
     def apply_emboss(img):
         return img.filter(ImageFilter.EMBOSS)
 
     @staticmethod
+    @_memoized
     def adjust_highlights(img, factor):
         # factor: 0.5 to 2.0
         # We want to affect pixels > 128
         # If factor > 1, we brighten highlights
         # If factor < 1, we darken highlights
         
-        # Create a lookup table
-        lut = []
-        for i in range(256):
-            if i <= 128:
-                lut.append(i)
-            else:
-                # Scale the part above 128
-                delta = i - 128
-                new_delta = delta * factor
-                new_val = 128 + new_delta
-                lut.append(int(min(255, max(0, new_val))))
+        # Lookup table, built once per factor
+        lut = _highlights_lut(factor)
         
         if img.mode == 'RGB':
             lut = lut * 3
         
         return img.point(lut)
-            
-    @staticmethod
-    def adjust_exposure(img, factor):
-        # Simple exposure adjustment (similar to brightness but often gamma based)
-        # For simplicity, we'll use brightness enhancement for now
-        enhancer = ImageEnhance.Brightness(img)
-        return enhancer.enhance(factor)
 
     @staticmethod
-    def apply_vignette(img, intensity=0.5):
-        if img.mode != 'RGB':
-            img = img.convert('RGB')
-        width, height = img.size
+    @_memoized
+    def adjust_tone(img, brightness=1.0, contrast=1.0, exposure=1.0, highlights=1.0):
+        # Brightness, contrast, exposure and highlights, in that order, as one
+        # point() pass: each step is a per-channel LUT, so they compose exactly
+        if img.mode not in ('RGB', 'L'):
+            img = ImageEditor.adjust_brightness(img, brightness)
+            img = ImageEditor.adjust_contrast(img, contrast)
+            img = ImageEditor.adjust_exposure(img, exposure)
+            return ImageEditor.adjust_highlights(img, highlights)
         
-        # Create a gradient mask
-        # Center is white (opaque), edges are black (transparent) -> wait, for vignette we want edges dark.
-        # So we want a mask that is white at center and black at edges, then multiply?
-        # Or create a black layer and use the mask to composite.
-        
-        # Let's create a radial gradient
-        # This is a bit complex to do purely with PIL efficiently without numpy, but let's try a simple way.
-        # Or just return original for now if too complex, but let's try.
+        lut = np.asarray(_blend_lut(0, brightness), dtype=np.intp)
+        if contrast != 1.0:
+            # Contrast blends from the mean gray level of the brightened image.
+            # With brightness at 1.0 that is the exact mean of the L conversion;
+            # otherwise it is the luma-weighted mean of the brightened channel
+            # histograms, which only skips PIL's per-pixel luma rounding.
+            if brightness == 1.0 or img.mode == 'L':
+                hist = np.asarray(img.convert("L").histogram(), dtype=np.int64)
+                mean = np.dot(hist, lut) / hist.sum()
+            else:
+                hist = np.asarray(img.histogram(), dtype=np.int64).reshape(3, 256)
+                channel_means = hist @ lut / hist[0].sum()
+                mean = np.dot(channel_means, _LUMA_WEIGHTS)
+            mean = int(mean + 0.5)
+            lut = np.asarray(_blend_lut(mean, contrast), dtype=np.intp)[lut]
+        lut = np.asarray(_blend_lut(0, exposure), dtype=np.intp)[lut]
+        lut = np.asarray(_highlights_lut(highlights), dtype=np.intp)[lut]
         
-        # Placeholder implementation: just return image for now to avoid complexity in this step
-        # Real implementation would require creating a radial gradient mask.
-        return img
-
+        return img.point(tuple(lut.tolist()) * len(img.getbands()))
+            
     @staticmethod
+    @_memoized
     def adjust_exposure(img, factor):
         # Exposure is effectively brightness multiplier
-        enhancer = ImageEnhance.Brightness(img)
-        return enhancer.enhance(factor)
+        return _enhance(img, ImageEnhance.Brightness, 0, factor)
 
     @staticmethod
+    @_memoized
     def apply_vignette(img, intensity=0.5):
-        # Create a gradient mask
+        if img.mode != "RGB":
+            img = img.convert("RGB")
+        # Radial gradient mask: center is white (keep), edges fade to black (darken)
         width, height = img.size
-        # Create a radial gradient
-        # We can use ImageOps.colorize or manual creation
-        # Simple way: Create a radial gradient image
-        
-        # Create a mask layer
-        mask = Image.new('L', (width, height), 255)
-        
-        # We need a radial gradient. 
-        # Let's use a simple distance calculation or a pre-made radial image if possible.
-        # Efficient way:
-        import math
-        
-        # Create a radial gradient
-        # Center
-        cx, cy = width / 2, height / 2
-        max_dist = math.sqrt(cx**2 + cy**2)
-        
-        # This is slow in pure python for large images.
-        # Better: Use a radial gradient image created via drawing
-        from PIL import ImageDraw
-        
-        # Create a radial gradient using draw
-        # Draw a large circle
-        # Actually, let's just darken corners.
-        
-        # Fast approximation:
-        # Create a smaller gradient and resize it
-        g_width, g_height = 256, 256
-        gradient = Image.new('L', (g_width, g_height), 0)
-        draw = ImageDraw.Draw(gradient)
-        
-        # Draw concentric circles
-        center_x, center_y = g_width // 2, g_height // 2
-        radius = max(center_x, center_y)
-        
-        for r in range(radius, 0, -1):
-            # Calculate alpha based on distance
-            # Center is white (transparent), edges are black (opaque)
-            # We want mask: Center=255 (keep), Edges=0 (darken)
-            
-            # Normalized distance from center (0 to 1)
-            dist = r / radius
-            # Falloff function
-            val = int(255 * (1 - dist**2)) # Quadratic falloff
-            draw.ellipse((center_x - r, center_y - r, center_x + r, center_y + r), fill=val)
-            
-        # Resize gradient to image size
-        mask = gradient.resize((width, height), Image.Resampling.LANCZOS)
+        mask = _vignette_mask(width, height, intensity)
         
         # Composite
-        # Create black image
-        black = Image.new('RGB', (width, height), (0, 0, 0))
+        # Start from a black image and paste the original through the mask
+        # (what Image.composite does, minus its copy of the black layer)
+        out = Image.new('RGB', (width, height), (0, 0, 0))
         
-        # Blend original and black using mask
         # Where mask is 255, we want original. Where 0, we want black.
-        return Image.composite(img, black, mask)
+        out.paste(img, mask=mask)
+        return out
 
     @staticmethod
+    @_memoized
     def apply_warmth(img):
-        # Increase Red, Decrease Blue
-        r, g, b = img.split()
-        r = r.point(lambda i: i * 1.1)
-        b = b.point(lambda i: i * 0.9)
-        return Image.merge('RGB', (r, g, b))
+        # Increase Red, Decrease Blue (one color-matrix pass, like sepia)
+        if img.mode != "RGB":
+            img = img.convert("RGB")
+        return img.convert("RGB", matrix=_WARMTH_MATRIX)
 
     @staticmethod
+    @_memoized
     def apply_cool(img):
-        # Increase Blue, Decrease Red
-        r, g, b = img.split()
-        r = r.point(lambda i: i * 0.9)
-        b = b.point(lambda i: i * 1.1)
-        return Image.merge('RGB', (r, g, b))
+        # Increase Blue, Decrease Red (one color-matrix pass, like sepia)
+        if img.mode != "RGB":
+            img = img.convert("RGB")
+        return img.convert("RGB", matrix=_COOL_MATRIX)
 
 
     @staticmethod
-    def skew(img, angle, direction='horizontal'):
+    @_memoized
+    def skew(img, angle, direction='horizontal', preview=False):
         # Skew using affine transform
         # angle is in degrees
-        import math
+        # preview=True resamples with NEAREST for interactive slider drags;
+        # the final render uses BICUBIC
+        resample = Image.Resampling.NEAREST if preview else Image.Resampling.BICUBIC
         
         # Convert angle to radians
         # Limit angle to avoid extreme distortion
@@ -209,12 +262,12 @@ class ImageEditor:
             # y' = y
             m = (1, tan_theta, 0, 0, 1, 0)
             new_width = width + int(abs(height * tan_theta))
-            return img.transform((new_width, height), Image.AFFINE, m, Image.Resampling.BICUBIC)
+            return img.transform((new_width, height), Image.AFFINE, m, resample)
         else:
             # x' = x
             # y' = y + x * tan(theta)
             m = (1, 0, 0, tan_theta, 1, 0)
             new_height = height + int(abs(width * tan_theta))
-            return img.transform((width, new_height), Image.AFFINE, m, Image.Resampling.BICUBIC)
+            return img.transform((width, new_height), Image.AFFINE, m, resample)
 
 
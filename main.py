@@ -2,11 +2,13 @@ import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 from PIL import Image, ImageTk
 import threading
+import weakref
 import os
+from concurrent.futures import ThreadPoolExecutor
 
 from image_ops import ImageEditor
-from utils import pil_to_tk
-from analysis import edges, noise, histogram, sharpness, report, metrics, artifacts
+from utils import fit_image, pil_to_tk
+from analysis import edges, noise, histogram, sharpness, report, metrics, artifacts, fused
 from transform_tools import create_transform_tools
 from crop_box import CropBox
 
@@ -31,10 +33,21 @@ class PyPicEditorApp:
         # Image state
         self.original_image = None
         self.current_image = None
+        self.preview_source = None  # original downscaled to the canvas
+        self.preview_image = None  # edited preview_source, what the canvas shows
         self.preview_image_tk = None
 
         # Analysis results
         self.analysis_results = {}
+        self._analysis_running = False
+        self.current_hist_plots = None  # histogram plots of the last analysis, for export
+        # Analysis thumbnails, reused by later runs when the size is unchanged
+        self.tk_edge_orig = self.tk_edge_edit = self.tk_edge_diff = None
+        self.tk_hist_orig = self.tk_hist_edit = self.tk_hist_diff = None
+        # Tab widget name -> pending render of its images, run when the tab is shown
+        self._stale_tabs = {}
+        # Worker pool for the independent analyses, kept for the app's lifetime
+        self._analysis_pool = ThreadPoolExecutor(max_workers=max(2, (os.cpu_count() or 2) - 1))
 
         # UI state
         self.sliders = {}
@@ -43,6 +56,26 @@ class PyPicEditorApp:
         self.transform_buttons = {}
         self.transform_section = None
 
+        # Pending after() jobs for debounced re-renders
+        self._pending_job = None
+        self._settle_job = None
+        self._resize_job = None
+        # Canvas size from the latest <Configure>, so redraws need no winfo query
+        self._canvas_size = (0, 0)
+        self._status_job = None  # clears the analysis status line
+
+        # Analysis-sized copy of the original, and the original it was made from
+        self._orig_small = None
+        self._orig_small_from = None
+        # Results of the last analysis with the images they were computed
+        # from: (original, weakref to the edited image, results)
+        self._last_analysis = None
+
+        # Source image, edit_state and preview flag of the last finished render
+        self._rendered_from = None
+        self._rendered_state = None
+        self._rendered_preview = False
+
         # Crop state
         self.crop_box = None
         self.crop_active = False
@@ -73,6 +106,8 @@ class PyPicEditorApp:
             "<B1-Motion>": None,
             "<ButtonRelease-1>": None,
         }
+        # Whether the crop handlers currently replace them
+        self._crop_bindings = False
 
         self.setup_theme()
         self.setup_layout()
@@ -245,7 +280,8 @@ class PyPicEditorApp:
 
     def on_filter_toggle(self, key):
         self.edit_state[key] = self.filter_vars[key].get()
-        self.apply_pipeline()
+        # Deferred to the event loop so several toggles in one turn render once
+        self.schedule_pipeline(delay=0)
 
     def create_slider(self, parent, label, state_key, min_val, max_val):
         frame = ttk.Frame(parent, style="Panel.TFrame")
@@ -294,27 +330,15 @@ class PyPicEditorApp:
             fill=MUTED_TEXT_COLOR,
             font=("Segoe UI", 14),
         )
+        # The one image item for the preview, created first so that it stays
+        # below the crop overlay; hidden until an image is loaded
+        self.canvas_image = self.canvas.create_image(400, 300, anchor=tk.CENTER, state=tk.HIDDEN)
 
         self.canvas.bind("<Configure>", self.on_canvas_resize)
 
-        # Default handlers (no-op but kept for future tools)
-        self.canvas.bind("<Button-1>", self.on_canvas_click)
-        self.canvas.bind("<B1-Motion>", self.on_canvas_drag)
-        self.canvas.bind("<ButtonRelease-1>", self.on_canvas_release)
-
-        self._default_canvas_bindings["<Button-1>"] = self.on_canvas_click
-        self._default_canvas_bindings["<B1-Motion>"] = self.on_canvas_drag
-        self._default_canvas_bindings["<ButtonRelease-1>"] = self.on_canvas_release
-
-    def on_canvas_click(self, event):
-        # Reserved for future tools (pan, pick, etc.)
-        pass
-
-    def on_canvas_drag(self, event):
-        pass
-
-    def on_canvas_release(self, event):
-        pass
+        # No mouse handlers outside crop mode: binding no-ops would still send
+        # every motion event through Python. Tools register theirs in
+        # _default_canvas_bindings to have them restored after cropping.
 
     # ----- Right panel -----
 
@@ -323,37 +347,59 @@ class PyPicEditorApp:
             self.right_panel, text="Analysis", style="Header.TLabel"
         ).pack(pady=10, padx=10, anchor="w")
 
-        ttk.Button(
+        self.btn_analyze = ttk.Button(
             self.right_panel, text="RUN FULL ANALYSIS", command=self.run_analysis_thread
-        ).pack(fill=tk.X, padx=10, pady=5)
+        )
+        self.btn_analyze.pack(fill=tk.X, padx=10, pady=5)
+
+        # Non-modal analysis progress, in place of a dialog per run
+        self.lbl_analysis_status = ttk.Label(self.right_panel, text="", style="Muted.TLabel")
+        self.lbl_analysis_status.pack(padx=10, anchor="w")
 
         self.notebook = ttk.Notebook(self.right_panel)
         self.notebook.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
 
-        # Tabs
+        # Tabs (their widgets are built on first view)
         self.tab_edges = ttk.Frame(self.notebook, style="Panel.TFrame")
         self.notebook.add(self.tab_edges, text="Edge")
-        self.setup_edge_tab()
 
         self.tab_noise = ttk.Frame(self.notebook, style="Panel.TFrame")
         self.notebook.add(self.tab_noise, text="Noise")
-        self.setup_noise_tab()
 
         self.tab_hist = ttk.Frame(self.notebook, style="Panel.TFrame")
         self.notebook.add(self.tab_hist, text="Hist")
-        self.setup_hist_tab()
 
         self.tab_metrics = ttk.Frame(self.notebook, style="Panel.TFrame")
         self.notebook.add(self.tab_metrics, text="Metrics")
-        self.setup_metrics_tab()
 
         self.tab_art = ttk.Frame(self.notebook, style="Panel.TFrame")
         self.notebook.add(self.tab_art, text="Artifacts")
-        self.setup_artifacts_tab()
 
         self.tab_summary = ttk.Frame(self.notebook, style="Panel.TFrame")
         self.notebook.add(self.tab_summary, text="Summary")
-        self.setup_summary_tab()
+
+        self._tab_setups = {
+            str(self.tab_edges): self.setup_edge_tab,
+            str(self.tab_noise): self.setup_noise_tab,
+            str(self.tab_hist): self.setup_hist_tab,
+            str(self.tab_metrics): self.setup_metrics_tab,
+            str(self.tab_art): self.setup_artifacts_tab,
+            str(self.tab_summary): self.setup_summary_tab,
+        }
+
+        self.notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed)
+        self._on_tab_changed()
+
+    def _on_tab_changed(self, event=None):
+        tab = self.notebook.select()
+        # Build the tab's widgets the first time it is shown
+        setup = self._tab_setups.pop(tab, None)
+        if setup:
+            setup()
+        # Fill in results the latest analysis has not drawn on this tab yet
+        render = self._stale_tabs.pop(tab, None)
+        if render:
+            render()
 
     def setup_metrics_tab(self):
         container = ttk.Frame(self.tab_metrics, style="Panel.TFrame")
@@ -467,18 +513,37 @@ class PyPicEditorApp:
         )
         if not path:
             return
+        # Decode off the UI thread so a large file does not freeze the window
+        threading.Thread(target=self._load_image, args=(path,), daemon=True).start()
+
+    def _load_image(self, path):
+        try:
+            img = Image.open(path).convert("RGB")
+        except Exception as e:
+            self.root.after(0, messagebox.showerror, "Error", f"Failed to open image: {e}")
+            return
+        self.root.after(0, self._on_image_loaded, img)
+
+    def _on_image_loaded(self, img):
         try:
-            self.original_image = Image.open(path).convert("RGB")
-            self.current_image = self.original_image.copy()
+            self.original_image = img
+            # Unedited, so the original itself is the current image (the editor
+            # ops never modify their input); no full-resolution copy
+            self.current_image = self.original_image
+            self._rebuild_preview_source()
             self.update_preview()
             self.reset_controls()
         except Exception as e:
             messagebox.showerror("Error", f"Failed to open image: {e}")
 
     def save_image(self):
-        if not self.current_image:
+        if not self.original_image:
             messagebox.showwarning("No Image", "There is no image to save.")
             return
+        # Renders the edits at full resolution if needed; None if that failed
+        image = self.current_image
+        if image is None:
+            return
         path = filedialog.asksaveasfilename(
             defaultextension=".png",
             filetypes=[("PNG", "*.png"), ("JPEG", "*.jpg")],
@@ -486,7 +551,7 @@ class PyPicEditorApp:
         if not path:
             return
         try:
-            self.current_image.save(path)
+            image.save(path)
             messagebox.showinfo("Saved", "Image saved successfully.")
         except Exception as e:
             messagebox.showerror("Error", f"Failed to save image: {e}")
@@ -494,7 +559,8 @@ class PyPicEditorApp:
     def reset_image(self):
         if not self.original_image:
             return
-        self.current_image = self.original_image.copy()
+        self.current_image = self.original_image
+        self._rebuild_preview_source()
         self.update_preview()
         self.reset_controls()
 
@@ -527,7 +593,22 @@ class PyPicEditorApp:
             self.edit_state[key] = val
             if label:
                 label.config(text=f"{int(val)}")
-        self.apply_pipeline()
+        self.schedule_pipeline(preview=True)
+
+    def schedule_pipeline(self, preview=False, delay=40):
+        """
+        Re-render after a short delay, replacing any render already pending,
+        so a burst of slider events only processes the latest value.
+        Preview renders are followed by a full-quality render once the
+        slider has been still for a moment.
+        """
+        if self._pending_job:
+            self.root.after_cancel(self._pending_job)
+        self._pending_job = self.root.after(delay, lambda: self.apply_pipeline(preview=preview))
+        if preview:
+            if self._settle_job:
+                self.root.after_cancel(self._settle_job)
+            self._settle_job = self.root.after(150, self.apply_pipeline)
 
     def apply_transform(self, type_):
         if not self.original_image:
@@ -539,91 +620,194 @@ class PyPicEditorApp:
         elif type_ == "crop":
             self.toggle_crop_mode()
             return
-        self.apply_pipeline()
-
-    def apply_pipeline(self):
+        self.schedule_pipeline(delay=0)
+
+    def apply_pipeline(self, preview=False):
+        # preview=True trades resampling quality for speed while a slider is dragged
+        # A direct call supersedes any debounced render still waiting to run;
+        # a full-quality render also makes the pending settle render redundant
+        if self._pending_job:
+            self.root.after_cancel(self._pending_job)
+            self._pending_job = None
+        if not preview and self._settle_job:
+            self.root.after_cancel(self._settle_job)
+            self._settle_job = None
         if not self.original_image:
             return
+        # Repeated slider values and toggle-untoggle sequences land on a state
+        # that is already on screen; nothing to redo then (a full-quality frame
+        # also stands in for a preview of the same state)
+        source = self.preview_source or self.original_image
+        state = dict(self.edit_state)
+        if (
+            self._rendered_from is source
+            and self._rendered_state == state
+            and (preview or not self._rendered_preview)
+        ):
+            return
         try:
-            img = self.original_image.copy()
-
-            # Rotation & skew
-            if self.edit_state.get("rotate", 0) != 0:
-                img = ImageEditor.rotate(img, self.edit_state["rotate"])
-            if self.edit_state.get("skew_x", 0) != 0:
-                img = ImageEditor.skew(img, self.edit_state["skew_x"], "horizontal")
-            if self.edit_state.get("skew_y", 0) != 0:
-                img = ImageEditor.skew(img, self.edit_state["skew_y"], "vertical")
-
-            # Filters
-            if self.edit_state.get("gray"):
-                img = ImageEditor.to_grayscale(img)
-            if self.edit_state.get("sepia"):
-                img = ImageEditor.apply_sepia(img)
-            if self.edit_state.get("blur"):
-                img = ImageEditor.blur(img)
-            if self.edit_state.get("sharpen"):
-                img = ImageEditor.sharpen(img)
-            if self.edit_state.get("emboss"):
-                img = ImageEditor.apply_emboss(img)
-            if self.edit_state.get("vignette"):
-                img = ImageEditor.apply_vignette(img)
-
-            # Tone
-            if self.edit_state.get("brightness", 1.0) != 1.0:
-                img = ImageEditor.adjust_brightness(img, self.edit_state["brightness"])
-            if self.edit_state.get("contrast", 1.0) != 1.0:
-                img = ImageEditor.adjust_contrast(img, self.edit_state["contrast"])
-            if self.edit_state.get("exposure", 1.0) != 1.0:
-                img = ImageEditor.adjust_exposure(img, self.edit_state["exposure"])
-            if self.edit_state.get("highlights", 1.0) != 1.0:
-                img = ImageEditor.adjust_highlights(img, self.edit_state["highlights"])
-
-            self.current_image = img
-            self.update_preview()
+            # Interactive edits only process the canvas-sized preview source;
+            # the full-resolution image is rendered when it is needed
+            self.preview_image = self._render(source, preview)
+            self.current_image = None
+            self.update_preview(preview)
+            self._rendered_from, self._rendered_state = source, state
+            self._rendered_preview = preview
         except Exception as e:
+            self._rendered_from = self._rendered_state = None
             messagebox.showerror("Error", f"Failed to apply effects: {e}")
-            if self.original_image is not None and self.current_image is None:
-                self.current_image = self.original_image.copy()
+            if self.preview_image is None:
+                self.preview_image = self.preview_source
                 self.update_preview()
 
-    def update_preview(self):
-        if not self.current_image:
-            self.canvas.delete("all")
-            self.canvas.create_text(
-                400,
-                300,
-                text="No image loaded",
-                fill=MUTED_TEXT_COLOR,
-                font=("Segoe UI", 14),
+    @property
+    def current_image(self):
+        """
+        The edited image at full resolution (save, crop, analysis).
+        Rendered from the original on first use after an edit; None, with
+        the error shown, if that render fails.
+        """
+        if self._current_image is None and self.original_image is not None:
+            try:
+                self._current_image = self._render(self.original_image)
+            except Exception as e:
+                messagebox.showerror("Error", f"Failed to apply effects: {e}")
+        return self._current_image
+
+    @current_image.setter
+    def current_image(self, img):
+        self._current_image = img
+
+    def _render(self, img, preview=False):
+        """
+        Run the edit pipeline on img (the original or its preview source).
+        Every ImageEditor op remembers its last result per input image, so a
+        stage whose input and settings are unchanged returns its cached output
+        and only the stages after the changed setting are recomputed.
+        """
+        # Start from the source itself (the editor ops never modify their input)
+        scale = img.width / self.original_image.width
+        img = self._apply_geom(img, preview)
+        img = self._apply_filters(img, scale)
+        return self._apply_tone(img)
+
+    def _apply_geom(self, img, preview=False):
+        # Rotation & skew
+        if self.edit_state.get("rotate", 0) != 0:
+            img = ImageEditor.rotate(img, self.edit_state["rotate"])
+        if self.edit_state.get("skew_x", 0) != 0:
+            img = ImageEditor.skew(img, self.edit_state["skew_x"], "horizontal", preview=preview)
+        if self.edit_state.get("skew_y", 0) != 0:
+            img = ImageEditor.skew(img, self.edit_state["skew_y"], "vertical", preview=preview)
+        return img
+
+    def _apply_filters(self, img, scale=1.0):
+        # Filters
+        if self.edit_state.get("gray"):
+            img = ImageEditor.to_grayscale(img)
+        if self.edit_state.get("sepia"):
+            img = ImageEditor.apply_sepia(img)
+        if self.edit_state.get("blur"):
+            # Radius in full-resolution pixels, scaled down with the preview
+            img = ImageEditor.blur(img, radius=2 * scale)
+        if self.edit_state.get("sharpen"):
+            img = ImageEditor.sharpen(img)
+        if self.edit_state.get("emboss"):
+            img = ImageEditor.apply_emboss(img)
+        if self.edit_state.get("vignette"):
+            img = ImageEditor.apply_vignette(img)
+        return img
+
+    def _apply_tone(self, img):
+        # Tone
+        tone = [self.edit_state.get(key, 1.0) for key in ("brightness", "contrast", "exposure", "highlights")]
+        if any(factor != 1.0 for factor in tone):
+            # All four tone adjustments in one fused LUT pass
+            img = ImageEditor.adjust_tone(img, *tone)
+        return img
+
+    def _rebuild_preview_source(self):
+        """Downscale the original to the canvas once; interactive edits render on this copy."""
+        w, h = self._canvas_size
+        if w <= 1 or h <= 1:
+            w, h = 800, 600
+
+        # Square bound so a 90 degree rotation still fills the canvas
+        side = max(w, h)
+        if max(self.original_image.size) <= side:
+            self.preview_source = self.original_image
+        else:
+            # Resize straight from the original rather than thumbnailing a full copy
+            img_w, img_h = self.original_image.size
+            fit = side / max(img_w, img_h)
+            size = (max(1, round(img_w * fit)), max(1, round(img_h * fit)))
+            self.preview_source = self.original_image.resize(
+                size, Image.Resampling.LANCZOS, reducing_gap=2.0
             )
+        self.preview_image = self.preview_source
+        # The canvas now shows the unedited source, whatever was rendered before
+        self._rendered_from = self._rendered_state = None
+
+    def update_preview(self, preview=False):
+        # preview=True fits with BILINEAR while sliders move; settled frames use LANCZOS
+        if self.preview_image is None:
+            self._show_placeholder(400, 300)
             return
 
-        w = self.canvas.winfo_width() or 800
-        h = self.canvas.winfo_height() or 600
+        w, h = self._canvas_size
+        w = w or 800
+        h = h or 600
+
+        # Resize straight to the fitted size; an image that already fits is shown
+        # as is (PhotoImage only reads it), so no full-size copy is made
+        img_w, img_h = self.preview_image.size
+        fit = min(w / img_w, h / img_h)
+        if fit < 1:
+            size = (max(1, round(img_w * fit)), max(1, round(img_h * fit)))
+            resample = Image.Resampling.BILINEAR if preview else Image.Resampling.LANCZOS
+            img_fit = self.preview_image.resize(size, resample, reducing_gap=2.0)
+        else:
+            img_fit = self.preview_image
 
-        img_copy = self.current_image.copy()
-        img_copy.thumbnail((w, h), Image.Resampling.LANCZOS)
+        # Most frames keep the fitted size: paste into the existing Tk photo and
+        # point the persistent canvas item at it instead of rebuilding both
+        photo = self.preview_image_tk
+        if photo is not None and (photo.width(), photo.height()) == img_fit.size:
+            photo.paste(img_fit)
+        else:
+            self.preview_image_tk = ImageTk.PhotoImage(img_fit)
 
-        self.preview_image_tk = ImageTk.PhotoImage(img_copy)
-        self.canvas.delete("all")
-        self.canvas.create_image(w // 2, h // 2, image=self.preview_image_tk, anchor=tk.CENTER)
+        self.canvas.itemconfigure(self.canvas_text, state=tk.HIDDEN)
+        self.canvas.itemconfigure(self.canvas_image, image=self.preview_image_tk, state=tk.NORMAL)
+        self.canvas.coords(self.canvas_image, w // 2, h // 2)
 
-        zoom = min(w / self.current_image.width, h / self.current_image.height) * 100
+        # Relative to full resolution: the preview is already downscaled by source_scale
+        source_scale = self.preview_source.width / self.original_image.width
+        zoom = min(w / self.preview_image.width, h / self.preview_image.height) * source_scale * 100
         self.lbl_zoom.config(text=f"{int(zoom)}%")
 
     def on_canvas_resize(self, event):
-        if self.current_image:
-            self.update_preview()
+        self._canvas_size = (event.width, event.height)
+        # Window drags fire <Configure> continuously; redraw once they settle
+        if self._resize_job:
+            self.root.after_cancel(self._resize_job)
+        self._resize_job = self.root.after(40, self._redraw_after_resize, event.width, event.height)
+
+    def _redraw_after_resize(self, width, height):
+        self._resize_job = None
+        if self.original_image:
+            # Re-render the edits on a preview source matching the new canvas size
+            self._rebuild_preview_source()
+            self.apply_pipeline()
         else:
-            self.canvas.delete("all")
-            self.canvas.create_text(
-                event.width // 2,
-                event.height // 2,
-                text="No image loaded",
-                fill=MUTED_TEXT_COLOR,
-                font=("Segoe UI", 14),
-            )
+            self._show_placeholder(width // 2, height // 2)
+
+    def _show_placeholder(self, x, y):
+        """Hide the preview image and show the "No image loaded" text at (x, y)."""
+        self.canvas.itemconfigure(self.canvas_image, image="", state=tk.HIDDEN)
+        self.preview_image_tk = None
+        self.canvas.coords(self.canvas_text, x, y)
+        self.canvas.itemconfigure(self.canvas_text, state=tk.NORMAL)
 
     # ================= ANALYSIS =================
 
@@ -631,124 +815,188 @@ class PyPicEditorApp:
         if self.original_image is None:
             messagebox.showerror("Error", "Please load an image first.")
             return
-        if self.current_image is None:
-            messagebox.showerror("Error", "Current image is missing.")
+        if self._analysis_running:
+            return
+        # Resolve both images here on the Tk thread: current_image renders from
+        # edit_state, which the UI keeps changing while the worker runs
+        original = self.original_image
+        edited = self.current_image
+        if edited is None:
             return
-        t = threading.Thread(target=self.run_analysis, daemon=True)
+        if self._status_job:
+            self.root.after_cancel(self._status_job)
+            self._status_job = None
+        # One analysis at a time; repeated clicks would only queue duplicate work
+        self._analysis_running = True
+        self.btn_analyze.config(state=tk.DISABLED)
+        self.lbl_analysis_status.config(text="Analyzing...")
+        t = threading.Thread(target=self.run_analysis, args=(original, edited), daemon=True)
         t.start()
 
-    def run_analysis(self):
+    def run_analysis(self, original, edited):
         try:
             ana_w, ana_h = 800, 800
-            img_orig_small = self.original_image.copy()
-            img_orig_small.thumbnail((ana_w, ana_h))
-
-            img_edit_small = self.current_image.copy()
-            img_edit_small.thumbnail((ana_w, ana_h))
-
-            if img_orig_small.size != img_edit_small.size:
-                img_edit_small = img_edit_small.resize(
-                    img_orig_small.size, Image.Resampling.LANCZOS
-                )
-
-            edge_res = edges.analyze_edges(img_orig_small, img_edit_small)
-            noise_res = noise.analyze_noise(img_orig_small, img_edit_small)
-            hist_res = histogram.analyze_histogram(img_orig_small, img_edit_small)
-            sharp_res = sharpness.analyze_sharpness(img_orig_small, img_edit_small)
-            metric_res = metrics.analyze_metrics(img_orig_small, img_edit_small)
-            art_comp = artifacts.detect_compression_artifacts(img_edit_small)
-            art_smooth = artifacts.detect_oversmoothing(img_edit_small)
+            # The original only changes on open and crop; downscale it once per image
+            if self._orig_small_from is not original:
+                self._orig_small = self._analysis_thumbnail(original, (ana_w, ana_h))
+                self._orig_small_from = original
+            img_orig_small = self._orig_small
+
+            # Images are never modified in place, so an analysis of the same
+            # original and edited objects gives the same results. Re-running it
+            # without an edit in between reuses them.
+            last = self._last_analysis
+            if last is not None and last[0] is original and last[1]() is edited:
+                res = last[2]
+            else:
+                # The analyses compare the two images pixel for pixel. An edit that
+                # kept the original's size gets the same thumbnail size; otherwise
+                # (rotate, skew) it is scaled straight to the original's analysis
+                # size in one resample instead of a thumbnail followed by a resize
+                if edited.size == original.size:
+                    img_edit_small = self._analysis_thumbnail(edited, (ana_w, ana_h))
+                else:
+                    img_edit_small = edited.resize(
+                        img_orig_small.size, Image.Resampling.LANCZOS, reducing_gap=2.0
+                    )
+
+                # The analyses are independent and spend their time in NumPy/SciPy
+                # code that releases the GIL, so run them side by side.
+                pair = (img_orig_small, img_edit_small)
+                # Filter both images in one stacked pass up front; the edge,
+                # noise and sharpness analyses then read the cached features
+                fused.gray_features_pair(*pair)
+                tasks = {
+                    "edge": (edges.analyze_edges, pair),
+                    "noise": (noise.analyze_noise, pair),
+                    "hist": (histogram.analyze_histogram, pair),
+                    "sharp": (sharpness.analyze_sharpness, pair),
+                    "metric": (metrics.analyze_metrics, pair),
+                    "art_comp": (artifacts.detect_compression_artifacts, (img_edit_small,)),
+                    "art_smooth": (artifacts.detect_oversmoothing, (img_edit_small,)),
+                }
+                futures = {
+                    key: self._analysis_pool.submit(fn, *args) for key, (fn, args) in tasks.items()
+                }
+                res = {key: future.result() for key, future in futures.items()}
+                self._last_analysis = (original, weakref.ref(edited), res)
+
+            # Scale the displayed images to their labels here, off the Tk thread
+            edge_size = getattr(self, "edge_target_size", (300, 200))
+            thumbs = {
+                "edge_orig": fit_image(res["edge"]["orig_edge"], edge_size),
+                "edge_edit": fit_image(res["edge"]["edited_edge"], edge_size),
+                "edge_diff": fit_image(res["edge"]["difference_map"], edge_size),
+                "hist_orig": fit_image(res["hist"]["plot_original"], (170, 100)),
+                "hist_edit": fit_image(res["hist"]["plot_edited"], (170, 100)),
+                "hist_diff": fit_image(res["hist"]["plot_diff"], (340, 100)),
+            }
 
             self.root.after(
                 0,
                 lambda: self.update_analysis_ui(
-                    edge_res,
-                    noise_res,
-                    hist_res,
-                    sharp_res,
-                    metric_res,
-                    art_comp,
-                    art_smooth,
+                    res["edge"],
+                    res["noise"],
+                    res["hist"],
+                    res["sharp"],
+                    res["metric"],
+                    res["art_comp"],
+                    res["art_smooth"],
+                    thumbs,
                 ),
             )
         except Exception as e:
-            self.root.after(
-                0,
-                lambda: messagebox.showerror("Analysis Error", f"Analysis failed:\n{e}"),
-            )
+            self.root.after(0, self._on_analysis_error, e)
+
+    def _analysis_done(self):
+        self._analysis_running = False
+        self.btn_analyze.config(state=tk.NORMAL)
+
+    def _on_analysis_error(self, error):
+        self._analysis_done()
+        self.lbl_analysis_status.config(text="Analysis failed.")
+        messagebox.showerror("Analysis Error", f"Analysis failed:\n{error}")
+
+    @staticmethod
+    def _analysis_thumbnail(img, max_size):
+        """
+        img scaled to fit max_size the way Image.thumbnail does (BICUBIC with a
+        reducing gap), but resized straight from img instead of from a
+        full-resolution copy. Images that already fit are returned as is; the
+        analyses only read their inputs.
+        """
+        fit = min(max_size[0] / img.width, max_size[1] / img.height)
+        if fit >= 1:
+            return img
+        size = (max(1, round(img.width * fit)), max(1, round(img.height * fit)))
+        return img.resize(size, Image.Resampling.BICUBIC, reducing_gap=2.0)
 
     def update_analysis_ui(
-        self, edge_res, noise_res, hist_res, sharp_res, metric_res, art_comp, art_smooth
+        self, edge_res, noise_res, hist_res, sharp_res, metric_res, art_comp, art_smooth, thumbs
     ):
+        self._analysis_done()
+
         # Store edge results for export
         self.analysis_results["edge"] = edge_res
 
-        # Edge images
-        w, h = getattr(self, "edge_target_size", (300, 200))
-        self.tk_edge_orig = pil_to_tk(edge_res["orig_edge"], (w, h))
-        self.img_edge_orig.config(image=self.tk_edge_orig)
+        # Every tab is filled in when it is shown (and built first if it has
+        # never been opened); the visible tab is drawn right away
+        self._stale_tabs = {
+            str(self.tab_edges): lambda: self._show_edges(edge_res, thumbs),
+            str(self.tab_noise): lambda: self._show_noise(noise_res),
+            str(self.tab_hist): lambda: self._show_hist(hist_res, thumbs),
+            str(self.tab_metrics): lambda: self._show_metrics(metric_res),
+            str(self.tab_art): lambda: self._show_artifacts(art_comp, art_smooth),
+            str(self.tab_summary): lambda: self._show_summary(
+                edge_res, noise_res, hist_res, sharp_res, metric_res, art_comp, art_smooth
+            ),
+        }
+        self._on_tab_changed()
 
-        self.tk_edge_edit = pil_to_tk(edge_res["edited_edge"], (w, h))
-        self.img_edge_edit.config(image=self.tk_edge_edit)
+        # Hist plots for export (only the combined image is ever saved)
+        self.current_hist_plots = {"combined": hist_res["plot_combined"]}
 
-        self.tk_edge_diff = pil_to_tk(edge_res["difference_map"], (w, h))
-        self.img_edge_diff.config(image=self.tk_edge_diff)
+        self.lbl_analysis_status.config(text="Analysis finished.")
+        self._status_job = self.root.after(3000, self._clear_analysis_status)
 
-        self.lbl_edge_stats.config(
-            text=f"Density Delta: {edge_res['density_delta']:.3f}"
-        )
+    def _clear_analysis_status(self):
+        self._status_job = None
+        self.lbl_analysis_status.config(text="")
 
-        # Noise
-        self.txt_noise.delete("1.0", tk.END)
-        self.txt_noise.insert(
-            tk.END, f"Original Noise: {noise_res['noise_original']:.3f}\n"
-        )
-        self.txt_noise.insert(
-            tk.END, f"Edited Noise:   {noise_res['noise_edited']:.3f}\n"
-        )
-        self.txt_noise.insert(
-            tk.END, f"Delta:          {noise_res['noise_delta']:.3f}\n"
-        )
+    def _set_text(self, widget, text):
+        # Replace a Text widget's contents in a single Tk call
+        widget.replace("1.0", tk.END, text)
 
-        # Histogram text
-        self.txt_hist.delete("1.0", tk.END)
-        self.txt_hist.insert(
-            tk.END, f"Brightness Delta: {hist_res['brightness_delta']:.2f}\n"
+    def _show_noise(self, noise_res):
+        self._set_text(
+            self.txt_noise,
+            f"Original Noise: {noise_res['noise_original']:.3f}\n"
+            f"Edited Noise:   {noise_res['noise_edited']:.3f}\n"
+            f"Delta:          {noise_res['noise_delta']:.3f}\n",
         )
-        self.txt_hist.insert(
-            tk.END, f"Contrast Delta:   {hist_res['contrast_delta']:.2f}\n"
-        )
-
-        # Hist plots
-        self.tk_hist_orig = pil_to_tk(hist_res["plot_original"], (170, 100))
-        self.lbl_hist_orig.config(image=self.tk_hist_orig)
-
-        self.tk_hist_edit = pil_to_tk(hist_res["plot_edited"], (170, 100))
-        self.lbl_hist_edit.config(image=self.tk_hist_edit)
 
-        self.tk_hist_diff = pil_to_tk(hist_res["plot_diff"], (340, 100))
-        self.lbl_hist_diff.config(image=self.tk_hist_diff)
-
-        # Metrics
-        self.txt_metrics.delete("1.0", tk.END)
-        self.txt_metrics.insert(tk.END, f"MSE:  {metric_res['mse']:.2f}\n")
-        self.txt_metrics.insert(tk.END, f"PSNR: {metric_res['psnr']:.2f} dB\n")
-        self.txt_metrics.insert(tk.END, f"SSIM: {metric_res['ssim']:.4f}\n")
-        self.txt_metrics.insert(tk.END, f"SNR (Orig): {metric_res['snr_orig']:.2f} dB\n")
-        self.txt_metrics.insert(tk.END, f"SNR (Edit): {metric_res['snr_edit']:.2f} dB\n")
-        self.txt_metrics.insert(
-            tk.END, f"Entropy (Orig): {metric_res['entropy_orig']:.2f}\n"
-        )
-        self.txt_metrics.insert(
-            tk.END, f"Entropy (Edit): {metric_res['entropy_edit']:.2f}\n"
+    def _show_metrics(self, metric_res):
+        self._set_text(
+            self.txt_metrics,
+            f"MSE:  {metric_res['mse']:.2f}\n"
+            f"PSNR: {metric_res['psnr']:.2f} dB\n"
+            f"SSIM: {metric_res['ssim']:.4f}\n"
+            f"SNR (Orig): {metric_res['snr_orig']:.2f} dB\n"
+            f"SNR (Edit): {metric_res['snr_edit']:.2f} dB\n"
+            f"Entropy (Orig): {metric_res['entropy_orig']:.2f}\n"
+            f"Entropy (Edit): {metric_res['entropy_edit']:.2f}\n",
         )
 
-        # Artifacts
-        self.txt_art.delete("1.0", tk.END)
-        self.txt_art.insert(tk.END, f"Compression Score:   {art_comp:.2f}\n")
-        self.txt_art.insert(tk.END, f"Oversmoothing Score: {art_smooth:.2f}\n")
+    def _show_artifacts(self, art_comp, art_smooth):
+        self._set_text(
+            self.txt_art,
+            f"Compression Score:   {art_comp:.2f}\n"
+            f"Oversmoothing Score: {art_smooth:.2f}\n",
+        )
 
-        # Summary
+    def _show_summary(
+        self, edge_res, noise_res, hist_res, sharp_res, metric_res, art_comp, art_smooth
+    ):
         summary = report.generate_summary_text(
             edge_res,
             noise_res,
@@ -757,21 +1005,44 @@ class PyPicEditorApp:
             metric_data=metric_res,
             art_data={"compression": art_comp, "smoothing": art_smooth},
         )
-        self.txt_summary.delete("1.0", tk.END)
-        self.txt_summary.insert(tk.END, summary)
-
-        # Hist plots for export
-        self.current_hist_plots = {
-            "original": hist_res["plot_original"],
-            "edited": hist_res["plot_edited"],
-            "diff": hist_res["plot_diff"],
-            "combined": hist_res["plot_combined"],
-        }
+        self._set_text(self.txt_summary, summary)
+
+    # thumbs holds the images already scaled to their labels by run_analysis,
+    # so pil_to_tk only wraps (or pastes) them here
+
+    def _show_edges(self, edge_res, thumbs):
+        w, h = getattr(self, "edge_target_size", (300, 200))
+        self.tk_edge_orig = pil_to_tk(thumbs["edge_orig"], (w, h), self.tk_edge_orig)
+        self.img_edge_orig.config(image=self.tk_edge_orig)
 
-        messagebox.showinfo("Analysis Complete", "Analysis finished.")
+        self.tk_edge_edit = pil_to_tk(thumbs["edge_edit"], (w, h), self.tk_edge_edit)
+        self.img_edge_edit.config(image=self.tk_edge_edit)
+
+        self.tk_edge_diff = pil_to_tk(thumbs["edge_diff"], (w, h), self.tk_edge_diff)
+        self.img_edge_diff.config(image=self.tk_edge_diff)
+
+        self.lbl_edge_stats.config(
+            text=f"Density Delta: {edge_res['density_delta']:.3f}"
+        )
+
+    def _show_hist(self, hist_res, thumbs):
+        self._set_text(
+            self.txt_hist,
+            f"Brightness Delta: {hist_res['brightness_delta']:.2f}\n"
+            f"Contrast Delta:   {hist_res['contrast_delta']:.2f}\n",
+        )
+
+        self.tk_hist_orig = pil_to_tk(thumbs["hist_orig"], (170, 100), self.tk_hist_orig)
+        self.lbl_hist_orig.config(image=self.tk_hist_orig)
+
+        self.tk_hist_edit = pil_to_tk(thumbs["hist_edit"], (170, 100), self.tk_hist_edit)
+        self.lbl_hist_edit.config(image=self.tk_hist_edit)
+
+        self.tk_hist_diff = pil_to_tk(thumbs["hist_diff"], (340, 100), self.tk_hist_diff)
+        self.lbl_hist_diff.config(image=self.tk_hist_diff)
 
     def save_histograms(self):
-        if not hasattr(self, "current_hist_plots"):
+        if self.current_hist_plots is None:
             messagebox.showerror("Error", "Run analysis first!")
             return
         if "combined" not in self.current_hist_plots:
@@ -787,7 +1058,12 @@ class PyPicEditorApp:
         if not path:
             return
         try:
-            self.current_hist_plots["combined"].save(path)
+            # The plot is small and flat-colored: fast zlib level for PNG
+            if os.path.splitext(path)[1].lower() in (".jpg", ".jpeg"):
+                options = {"quality": 85}
+            else:
+                options = {"compress_level": 1}
+            self.current_hist_plots["combined"].save(path, **options)
             messagebox.showinfo("Saved", f"Combined histograms saved to:\n{path}")
         except Exception as e:
             messagebox.showerror("Error", f"Failed to save histograms: {e}")
@@ -840,13 +1116,13 @@ class PyPicEditorApp:
 
     def toggle_crop_mode(self):
         """Toggle crop mode on/off."""
-        if not self.current_image:
+        if not self.original_image:
             messagebox.showwarning("No Image", "Please load an image first.")
             return
 
         if self.crop_active:
             self.cancel_crop()
-        else:
+        elif self.current_image is not None:
             self._activate_crop_mode()
 
     def _activate_crop_mode(self):
@@ -862,8 +1138,7 @@ class PyPicEditorApp:
             self.crop_box = None
 
         # Determine displayed image bounds on canvas (must match update_preview)
-        w_canvas = self.canvas.winfo_width()
-        h_canvas = self.canvas.winfo_height()
+        w_canvas, h_canvas = self._canvas_size
         img_w, img_h = self.current_image.size
 
         if img_w == 0 or img_h == 0 or w_canvas <= 1 or h_canvas <= 1:
@@ -890,10 +1165,12 @@ class PyPicEditorApp:
 
         self._show_crop_buttons()
 
-        # Override mouse bindings for crop interaction
-        self.canvas.bind("<Button-1>", self._on_crop_click)
-        self.canvas.bind("<B1-Motion>", self._on_crop_drag)
-        self.canvas.bind("<ButtonRelease-1>", self._on_crop_release)
+        # Override mouse bindings for crop interaction, unless they already are
+        if not self._crop_bindings:
+            self.canvas.bind("<Button-1>", self._on_crop_click)
+            self.canvas.bind("<B1-Motion>", self._on_crop_drag)
+            self.canvas.bind("<ButtonRelease-1>", self._on_crop_release)
+            self._crop_bindings = True
 
     def _show_crop_buttons(self):
         """Show ✓ Confirm / ✗ Cancel buttons in the preview header."""
@@ -974,8 +1251,13 @@ class PyPicEditorApp:
             messagebox.showwarning("Invalid Crop", "Crop area too small.")
             return
 
+        box = (img_x0, img_y0, img_x1, img_y1)
         try:
-            cropped_img = self.current_image.crop((img_x0, img_y0, img_x1, img_y1))
+            # A selection covering the whole image keeps it as is, uncopied
+            if box == (0, 0, img_w, img_h):
+                cropped_img = self.current_image
+            else:
+                cropped_img = self.current_image.crop(box)
         except Exception as e:
             messagebox.showerror("Error", f"Failed to crop image: {e}")
             self.cancel_crop()
@@ -983,7 +1265,8 @@ class PyPicEditorApp:
 
         # After crop, treat cropped image as new original
         self.original_image = cropped_img
-        self.current_image = cropped_img.copy()
+        self.current_image = cropped_img
+        self._rebuild_preview_source()
 
         self.cancel_crop()
         self.reset_controls()
@@ -1008,20 +1291,17 @@ class PyPicEditorApp:
             except Exception:
                 pass
 
-        # Restore default mouse handlers
-        try:
-            self.canvas.bind("<Button-1>", self._default_canvas_bindings["<Button-1>"])
-            self.canvas.bind(
-                "<B1-Motion>", self._default_canvas_bindings["<B1-Motion>"]
-            )
-            self.canvas.bind(
-                "<ButtonRelease-1>",
-                self._default_canvas_bindings["<ButtonRelease-1>"],
-            )
-        except Exception:
-            self.canvas.bind("<Button-1>", self.on_canvas_click)
-            self.canvas.bind("<B1-Motion>", self.on_canvas_drag)
-            self.canvas.bind("<ButtonRelease-1>", self.on_canvas_release)
+        # Restore default mouse handlers, unbinding the events that have none.
+        # Only needed once after the crop handlers went in; repeated cancels
+        # and crop mode exits that never bound them skip it.
+        if not self._crop_bindings:
+            return
+        self._crop_bindings = False
+        for sequence, handler in self._default_canvas_bindings.items():
+            if handler:
+                self.canvas.bind(sequence, handler)
+            else:
+                self.canvas.unbind(sequence)
 
 
 if __name__ == "__main__":
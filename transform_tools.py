@@ -10,6 +10,10 @@ class CircularButton(tk.Canvas):
         self.text_color = text_color
         self.size = size
         self.is_active = False  # Track active state
+        # (circle fill, icon fill) per state; dark icon on the bright hover fill
+        self._normal_colors = (bg_color, text_color)
+        self._hover_colors = (hover_color, "#121212")
+        self._colors = self._normal_colors
         
         # Draw Circle
         pad = 4
@@ -21,28 +25,20 @@ class CircularButton(tk.Canvas):
         # Draw Label
         self.label = self.create_text(size/2, size + 10, text=label_text, fill=text_color, font=("Segoe UI", 8))
         
-        # Bind events
+        # Bind events on the widget only: the whole canvas is the button, and
+        # item bindings would fire in addition to these (a click on the icon
+        # ran the command twice)
         self.bind("<Enter>", self.on_enter)
         self.bind("<Leave>", self.on_leave)
         self.bind("<Button-1>", self.on_click)
         
-        # Bind to items as well
-        self.tag_bind(self.circle, "<Button-1>", self.on_click)
-        self.tag_bind(self.icon, "<Button-1>", self.on_click)
-        self.tag_bind(self.circle, "<Enter>", self.on_enter)
-        self.tag_bind(self.icon, "<Enter>", self.on_enter)
-        self.tag_bind(self.label, "<Button-1>", self.on_click)
-        self.tag_bind(self.label, "<Enter>", self.on_enter)
-        
     def on_enter(self, event):
         if not self.is_active:  # Only change on hover if not active
-            self.itemconfig(self.circle, fill=self.hover_color)
-            self.itemconfig(self.icon, fill="#121212") # Dark icon on bright bg
+            self._paint(self._hover_colors)
         
     def on_leave(self, event):
         if not self.is_active:  # Only revert if not active
-            self.itemconfig(self.circle, fill=self.bg_color)
-            self.itemconfig(self.icon, fill=self.text_color)
+            self._paint(self._normal_colors)
         
     def on_click(self, event):
         if self.command:
@@ -50,12 +46,16 @@ class CircularButton(tk.Canvas):
 
     def set_active(self, is_active):
         self.is_active = is_active
-        if is_active:
-            self.itemconfig(self.circle, fill=self.hover_color)
-            self.itemconfig(self.icon, fill="#121212")
-        else:
-            self.itemconfig(self.circle, fill=self.bg_color)
-            self.itemconfig(self.icon, fill=self.text_color)
+        self._paint(self._hover_colors if is_active else self._normal_colors)
+
+    def _paint(self, colors):
+        # set_active(False) on a button that is not lit repeats the current colors
+        if colors is self._colors:
+            return
+        self._colors = colors
+        circle_fill, icon_fill = colors
+        self.itemconfig(self.circle, fill=circle_fill)
+        self.itemconfig(self.icon, fill=icon_fill)
 
 def create_transform_tools(parent, app):
     container = ttk.Frame(parent, style="Panel.TFrame")
@@ -111,6 +111,8 @@ def create_transform_tools(parent, app):
     
     app.transform_scale = ttk.Scale(app.transform_slider_frame, from_=-180, to=180, command=lambda v: on_transform_slider(app, v))
     app.transform_scale.pack(fill=tk.X)
+    # Drags render a fast preview; re-render at full quality on release
+    app.transform_scale.bind("<ButtonRelease-1>", lambda e: app.schedule_pipeline(delay=0))
     
     # Close slider button
     ttk.Button(app.transform_slider_frame, text="Done", command=lambda: hide_slider_panel(app)).pack(pady=2)
@@ -173,4 +175,4 @@ def on_transform_slider(app, value):
         app.edit_state['skew_y'] = val
         app.transform_slider_value.config(text=f"{int(val)}°")
         
-    app.apply_pipeline()
+    app.schedule_pipeline(preview=True)
@@ -1,14 +1,32 @@
 import numpy as np
 from PIL import Image, ImageTk
 
-def pil_to_tk(img, max_size=(320, 320)):
+def fit_image(img, max_size=(320, 320)):
+    """
+    Scale a PIL Image down to fit within max_size, keeping its aspect ratio.
+    Images that already fit are returned as is (not copied).
+    """
+    if img.width <= max_size[0] and img.height <= max_size[1]:
+        return img
+    ratio = min(max_size[0] / img.width, max_size[1] / img.height)
+    size = (max(1, round(img.width * ratio)), max(1, round(img.height * ratio)))
+    # One resize into a new image instead of a copy that thumbnail() then
+    # replaces. BILINEAR is antialiased when downscaling in PIL and is about
+    # 3x faster than LANCZOS; plenty for the small analysis thumbnails
+    return img.resize(size, Image.Resampling.BILINEAR, reducing_gap=2.0)
+
+def pil_to_tk(img, max_size=(320, 320), photo=None):
     """
     Convert a PIL Image to a Tkinter-compatible PhotoImage, 
     resizing it to fit within max_size while maintaining aspect ratio.
+    If photo is a PhotoImage of the fitted size, the pixels are pasted into
+    it and it is returned instead of allocating a new one.
     """
-    img_copy = img.copy()
-    img_copy.thumbnail(max_size, Image.Resampling.LANCZOS)
-    return ImageTk.PhotoImage(img_copy)
+    img_fit = fit_image(img, max_size)
+    if photo is not None and (photo.width(), photo.height()) == img_fit.size:
+        photo.paste(img_fit)
+        return photo
+    return ImageTk.PhotoImage(img_fit)
 
 def ensure_rgb(img):
     """Ensure image is in RGB mode."""
@@ -16,12 +34,22 @@ def ensure_rgb(img):
         return img.convert('RGB')
     return img
 
-def normalize_array(arr):
-    """Normalize a numpy array to 0-255 range for image display."""
+def normalize_array(arr, out=None):
+    """
+    Normalize a numpy array to 0-255 range for image display.
+    out, if given, is a float scratch array of arr's shape (it may be arr
+    itself) that holds the intermediate scaling in place of a new temporary.
+    """
     arr_min = arr.min()
     arr_max = arr.max()
     if arr_max - arr_min == 0:
         return np.zeros_like(arr, dtype=np.uint8)
     
-    norm = (arr - arr_min) / (arr_max - arr_min) * 255
+    # Scale in place in a single scratch buffer. Integer input is subtracted
+    # straight into a float one rather than into an integer temporary first.
+    if out is None and arr.dtype.kind != 'f':
+        out = np.empty(arr.shape, dtype=np.float64)
+    norm = np.subtract(arr, arr_min, out=out)
+    norm /= arr_max - arr_min
+    norm *= 255
     return norm.astype(np.uint8)